@@ -41,6 +41,7 @@ setup(
     download_url="http://github.com/altair-viz/vega_datasets",
     license="MIT",
     install_requires=["pandas"],
+    extras_require={"arrow": ["pyarrow"], "polars": ["polars"]},
     python_requires=">=3.5",
     tests_require=["pytest"],
     packages=find_packages(exclude=["tools"]),
@@ -0,0 +1,72 @@
+"""
+Tool to compare date parsing with registered formats against pandas'
+format inference, for every dataset that declares ``_date_formats``.
+
+Usage:
+$ python benchmark_date_parsing.py [--remote] [--repeat N]
+
+By default only bundled datasets are timed; pass --remote to include
+datasets that must be downloaded.
+"""
+
+import argparse
+from io import BytesIO
+from os.path import abspath, join, dirname
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(1, abspath(join(dirname(__file__), "..")))
+from vega_datasets.core import Dataset
+
+
+def _time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(remote=False, repeat=10):
+    print(
+        "{0:<20} {1:>12} {2:>12} {3:>8}".format(
+            "name", "infer (ms)", "fmt (ms)", "speedup"
+        )
+    )
+    for name in Dataset.list_datasets():
+        loader = Dataset.init(name)
+        if not loader._date_formats:
+            continue
+        if not (loader.is_local or remote):
+            continue
+        raw = loader.raw()
+        key = "convert_dates" if loader.format == "json" else "parse_dates"
+        infer_kwds = {key: list(loader._date_formats)}
+        if loader.format == "tsv":
+            infer_kwds["sep"] = "\t"
+        reader = pd.read_json if loader.format == "json" else pd.read_csv
+
+        def infer():
+            return reader(BytesIO(raw), **infer_kwds)
+
+        def fast():
+            kwds = loader._pd_read_kwds.copy()
+            formats = loader._split_date_formats(kwds, {})
+            data = reader(BytesIO(raw), **kwds)
+            for col, fmt in formats.items():
+                data[col] = pd.to_datetime(data[col], format=fmt)
+            return data
+
+        t_infer = _time(infer, repeat) * 1000
+        t_fast = _time(fast, repeat) * 1000
+        print(
+            "{0:<20} {1:>12.2f} {2:>12.2f} {3:>7.2f}x".format(
+                name, t_infer, t_fast, t_infer / t_fast
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--remote", action="store_true")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    main(remote=args.remote, repeat=args.repeat)
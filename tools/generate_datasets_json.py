@@ -5,13 +5,41 @@ $ python generate_datasets_json.py v1.24.0
 
 The second argument is the name of the desired version tag within
 http://github.com/vega/vega-datasets/
+
+Along with the filename and format, each entry records the file size,
+its sha256 hash, and for datasets that are tables of records the number of rows and the
+column names and dtypes produced by the pandas loader.
 """
 
+import hashlib
 import json
 import os
 import subprocess
 import sys
 
+sys.path.insert(1, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def dataset_metadata(name, content):
+    """Compute size, hash, and (if tabular) row count and schema of a dataset"""
+    from vega_datasets import core
+
+    metadata = {"size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+    loader = core.Dataset.init(name)
+    # parse the given bytes rather than the bundled or remote file
+    loader.raw = lambda **kwargs: content
+    if not loader._is_table():
+        return metadata
+    try:
+        df = loader(backend="pandas")
+    except Exception as err:
+        print(f"  could not parse {name}: {err}")
+        return metadata
+    metadata["rows"] = len(df)
+    metadata["columns"] = [str(col) for col in df.columns]
+    metadata["dtypes"] = [str(dtype) for dtype in df.dtypes]
+    return metadata
+
 
 def main(tag):
     cwd = os.path.dirname(__file__)
@@ -40,6 +68,16 @@ def main(tag):
     with open(datasets_file, "w") as f:
         json.dump(datasets, f, indent=2, sort_keys=True)
 
+    # dataset_metadata() imports the loaders, which read datasets.json
+    print("Computing dataset metadata")
+    for name, info in sorted(datasets.items()):
+        with open(os.path.join(data_dir, info["filename"]), "rb") as f:
+            info.update(dataset_metadata(name, f.read()))
+
+    print(f"Writing datsets metadata to {datasets_file}")
+    with open(datasets_file, "w") as f:
+        json.dump(datasets, f, indent=2, sort_keys=True)
+
     print("Updating SOURCE_TAG in core file")
     subprocess.check_call(
         ["sed", "-i", ".bak", f"s/SOURCE_TAG.*/SOURCE_TAG = {tag!r}/g", core_file]
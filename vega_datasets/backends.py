@@ -0,0 +1,223 @@
+"""Readers that build Arrow tables or Polars frames directly from raw bytes.
+
+These are used by :class:`vega_datasets.core.Dataset` when a backend other
+than pandas is requested. pyarrow and polars are optional dependencies and
+are only imported when the corresponding backend is used.
+"""
+
+import copy
+from io import BytesIO
+import json
+from typing import Any, Dict, List, Optional
+import warnings
+
+BACKENDS = ("pandas", "arrow", "polars")
+
+
+def validate_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(
+            "Unrecognized backend: {0}. "
+            "Valid options are {1}.".format(backend, list(BACKENDS))
+        )
+    return backend
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("The 'arrow' backend requires pyarrow to be installed.")
+    return pyarrow
+
+
+def _import_polars():
+    try:
+        import polars
+    except ImportError:
+        raise ImportError("The 'polars' backend requires polars to be installed.")
+    return polars
+
+
+def _mismatch_warning(name: str, fmt: str) -> None:
+    warnings.warn(
+        "Column {0!r} does not match date format {1!r}; "
+        "falling back to format inference.".format(name, fmt)
+    )
+
+
+def _arrow_from_records(records: List[Dict[str, Any]]) -> Any:
+    """Build an Arrow table with a column for every key of any record.
+
+    ``pyarrow.Table.from_pylist`` takes the columns from the first record
+    only; pandas and polars use the union of the keys.
+    """
+    pa = _import_pyarrow()
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    return pa.table({key: [record.get(key) for record in records] for key in keys})
+
+
+def read_arrow(
+    raw: bytes,
+    format: str,
+    date_formats: Dict[str, Optional[str]],
+    string_columns: List[str],
+    **kwargs
+) -> Any:
+    """Parse raw dataset bytes into a ``pyarrow.Table``.
+
+    Parameters
+    ----------
+    raw : bytes
+        The raw dataset contents.
+    format : string
+        One of {'csv', 'tsv', 'json'}.
+    date_formats : dict
+        Mapping of date column to strftime format, or None to infer.
+    string_columns : list
+        Columns that must be kept as strings.
+    **kwargs :
+        additional keyword arguments are passed to ``pyarrow.csv.read_csv``
+        for CSV and TSV data. Column types given in ``convert_options`` take
+        precedence over the string types forced for date and string columns.
+        JSON data does not accept keyword arguments.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc
+
+    if format in ("csv", "tsv"):
+        import pyarrow.csv as pacsv
+
+        column_types = {col: pa.string() for col in string_columns}
+        column_types.update({col: pa.string() for col in date_formats})
+        kwargs.setdefault(
+            "parse_options",
+            pacsv.ParseOptions(delimiter="\t" if format == "tsv" else ","),
+        )
+        convert_options = kwargs.get("convert_options")
+        if convert_options is None:
+            convert_options = pacsv.ConvertOptions()
+        else:
+            convert_options = copy.copy(convert_options)
+        column_types.update(convert_options.column_types)
+        convert_options.column_types = column_types
+        kwargs["convert_options"] = convert_options
+        table = pacsv.read_csv(BytesIO(raw), **kwargs)
+    elif format == "json":
+        if kwargs:
+            raise TypeError(
+                "The 'arrow' backend does not accept keyword arguments for "
+                "JSON data: {0}".format(sorted(kwargs))
+            )
+        table = _arrow_from_records(json.loads(raw.decode()))
+    else:
+        raise ValueError(
+            "Unrecognized file format: {0}. "
+            "Valid options are ['json', 'csv', 'tsv']."
+            "".format(format)
+        )
+
+    for col, fmt in date_formats.items():
+        if col not in table.column_names:
+            continue
+        values = table[col]
+        if pa.types.is_timestamp(values.type):
+            continue
+        if pa.types.is_integer(values.type) or pa.types.is_floating(values.type):
+            values = pc.cast(pc.cast(values, pa.int64()), pa.timestamp("ms"))
+            converted = pc.cast(values, pa.timestamp("ns"))
+        elif fmt is None:
+            converted = pc.cast(values, pa.timestamp("ns"))
+        else:
+            try:
+                converted = pc.strptime(values, format=fmt, unit="ns")
+            except pa.ArrowInvalid:
+                _mismatch_warning(col, fmt)
+                converted = pc.cast(values, pa.timestamp("ns"))
+        table = table.set_column(table.column_names.index(col), col, converted)
+    return table
+
+
+def read_polars(
+    raw: bytes,
+    format: str,
+    date_formats: Dict[str, Optional[str]],
+    string_columns: List[str],
+    **kwargs
+) -> Any:
+    """Parse raw dataset bytes into a ``polars.DataFrame``.
+
+    Parameters are as in :func:`read_arrow`; ``**kwargs`` are passed to
+    ``polars.read_csv`` or ``polars.read_json``. For CSV and TSV data, a
+    user-supplied ``schema_overrides`` is merged with the forced types.
+    """
+    pl = _import_polars()
+
+    if format in ("csv", "tsv"):
+        overrides = {col: pl.Utf8 for col in string_columns}
+        overrides.update({col: pl.Utf8 for col in date_formats})
+        overrides.update(kwargs.get("schema_overrides") or {})
+        kwargs.setdefault("separator", "\t" if format == "tsv" else ",")
+        kwargs["schema_overrides"] = overrides
+        frame = pl.read_csv(BytesIO(raw), **kwargs)
+    elif format == "json":
+        frame = pl.read_json(BytesIO(raw), **kwargs)
+        frame = frame.with_columns(
+            [
+                pl.col(col).cast(pl.Utf8)
+                for col in string_columns
+                if col in frame.columns
+            ]
+        )
+    else:
+        raise ValueError(
+            "Unrecognized file format: {0}. "
+            "Valid options are ['json', 'csv', 'tsv']."
+            "".format(format)
+        )
+
+    for col, fmt in date_formats.items():
+        if col not in frame.columns:
+            continue
+        dtype = frame.schema[col]
+        if dtype.is_temporal():
+            continue
+        if dtype.is_numeric():
+            converted = pl.from_epoch(frame[col].cast(pl.Int64), time_unit="ms")
+        elif fmt is None:
+            converted = frame[col].str.to_datetime(time_unit="ns")
+        else:
+            try:
+                converted = frame[col].str.strptime(pl.Datetime("ns"), fmt)
+            except pl.exceptions.PolarsError:
+                _mismatch_warning(col, fmt)
+                converted = frame[col].str.to_datetime(time_unit="ns")
+        frame = frame.with_columns(converted.cast(pl.Datetime("ns")).alias(col))
+    return frame
+
+
+def from_records(records: List[Dict[str, Any]], backend: str) -> Any:
+    """Build an Arrow table or Polars frame from a list of records"""
+    if backend == "arrow":
+        return _arrow_from_records(records)
+    return _import_polars().DataFrame(records)
+
+
+def pivot(data: Any, backend: str, index: str, columns: str, values: str) -> Any:
+    """Pivot long-form data so that each value of ``columns`` is its own
+    column, with rows sorted by ``index`` and columns sorted by name."""
+    if backend == "polars":
+        out = data.pivot(on=columns, index=index, values=values).sort(index)
+        return out.select([index] + sorted(c for c in out.columns if c != index))
+
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc
+
+    keys = pc.unique(data[index])
+    keys = pc.take(keys, pc.sort_indices(keys))
+    result = {index: keys}
+    for name in sorted(pc.unique(data[columns]).to_pylist()):
+        subset = data.filter(pc.equal(data[columns], name))
+        positions = pc.index_in(keys, value_set=subset[index])
+        result[name] = pc.take(subset[values], positions)
+    return pa.table(result)
@@ -0,0 +1,126 @@
+"""Load several datasets at once in a pool of processes.
+
+Results are sent back to the parent with pickle protocol 5: the pickle
+stream itself is small, and the out-of-band data buffers (e.g. the
+columns of a dataframe) are copied once into a shared memory block
+rather than being serialized into the stream. Before Python 3.8, which has
+neither protocol 5 nor shared memory, results are pickled in-band.
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: no cover
+    shared_memory = None  # type: ignore
+
+# On Windows a shared memory block is freed when its last handle is closed,
+# so it cannot outlive the worker that created it.
+_USE_SHARED_MEMORY = (
+    sys.version_info >= (3, 8) and shared_memory is not None and sys.platform != "win32"
+)
+
+_Payload = Tuple[bytes, Optional[str], List[int]]
+
+
+def _create_shared_memory(size: int) -> Any:
+    try:
+        return shared_memory.SharedMemory(
+            create=True, size=size, track=False  # type: ignore
+        )
+    except TypeError:
+        # Python < 3.13: the parent unlinks the block, so stop the resource
+        # tracker from also cleaning it up when this worker exits.
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+        return shm
+
+
+def dump(obj: Any) -> _Payload:
+    """Serialize ``obj``, placing its out-of-band buffers in shared memory.
+
+    Returns the pickle stream, the name of the shared memory block (or None
+    if nothing was placed there) and the size of each buffer.
+    """
+    if not _USE_SHARED_MEMORY:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), None, []
+    buffers = []  # type: List[pickle.PickleBuffer]
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return payload, None, []
+    views = [buffer.raw() for buffer in buffers]
+    sizes = [view.nbytes for view in views]
+    shm = _create_shared_memory(max(sum(sizes), 1))
+    offset = 0
+    for view, size in zip(views, sizes):
+        shm.buf[offset : offset + size] = view
+        offset += size
+    name = shm.name
+    shm.close()
+    return payload, name, sizes
+
+
+def load(payload: bytes, name: Optional[str], sizes: Sequence[int]) -> Any:
+    """Deserialize the output of :func:`dump`, freeing its shared memory."""
+    if name is None:
+        return pickle.loads(payload)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buffers = []
+        offset = 0
+        for size in sizes:
+            buffers.append(bytearray(shm.buf[offset : offset + size]))  # type: ignore
+            offset += size
+    finally:
+        shm.close()
+        shm.unlink()
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _load_dataset(name: str, default_backend: str, kwargs: Dict[str, Any]) -> _Payload:
+    from vega_datasets.core import Dataset
+
+    Dataset.default_backend = default_backend
+    return dump(Dataset.init(name)(**kwargs))
+
+
+def load_many(
+    names: Sequence[str], default_backend: str, workers: Optional[int] = None, **kwargs
+) -> Dict[str, Any]:
+    """Load the named datasets in up to ``workers`` processes.
+
+    Returns a dictionary mapping each name to its result.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(names))
+    if workers <= 1:
+        from vega_datasets.core import Dataset
+
+        return {name: Dataset.init(name)(**kwargs) for name in names}
+
+    # Forked workers deadlock in libraries with thread pools that the parent
+    # has already started (e.g. polars), so start them fresh.
+    pool_kwds = {}  # type: Dict[str, Any]
+    if sys.version_info >= (3, 7):
+        pool_kwds["mp_context"] = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, **pool_kwds) as pool:
+        futures = {
+            name: pool.submit(_load_dataset, name, default_backend, kwargs)
+            for name in names
+        }
+    # Every load has finished: collect all of them, even after an error, so
+    # that no shared memory is left behind.
+    results = {}
+    error = None
+    for name, future in futures.items():
+        try:
+            results[name] = load(*future.result())
+        except Exception as err:
+            error = error or err
+    if error is not None:
+        raise error
+    return results
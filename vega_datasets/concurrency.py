@@ -0,0 +1,134 @@
+"""Helpers for loading datasets safely from many threads and processes.
+
+:func:`single_flight` makes concurrent calls with the same arguments share
+one in-progress load, and :class:`FileLock` serializes writes to the
+dataset store between processes.
+"""
+
+import copy
+import functools
+import os
+import sys
+import threading
+from typing import Any, Callable, Hashable, Tuple
+
+import pandas as pd
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock(object):
+    """Advisory, exclusive lock on ``path`` held within a ``with`` block.
+
+    The lock blocks other processes as well as other threads, since each
+    acquisition opens its own file descriptor.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None  # type: Any
+
+    def __enter__(self) -> "FileLock":
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            _unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class _Call(object):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None  # type: Any
+        self.error = None  # type: Any
+
+
+class SingleFlight(object):
+    """Deduplicate concurrent calls that share a key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in progress wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}  # type: dict
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return ``func()`` and whether the result is shared with another
+        caller."""
+        with self._lock:
+            leader = key not in self._calls
+            if leader:
+                self._calls[key] = _Call()
+            call = self._calls[key]
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+def _copy_result(result: Any) -> Any:
+    """Copy mutable results so that callers sharing a load are independent"""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy_result(item) for item in result)
+    if isinstance(result, dict):
+        return copy.deepcopy(result)
+    return result
+
+
+def single_flight(method: Callable) -> Callable:
+    """Decorate a ``Dataset`` loading method so that concurrent calls for the
+    same dataset and arguments wait on a single load.
+
+    Callers that did not run the load receive a copy of the result.
+    """
+    flight = SingleFlight()
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (type(self), self.name, repr(args), repr(sorted(kwargs.items())))
+        result, shared = flight.do(key, lambda: method(self, *args, **kwargs))
+        return _copy_result(result) if shared else result
+
+    return wrapper
@@ -1,12 +1,25 @@
+from contextlib import closing
 from io import BytesIO
 import os
 import json
 import pkgutil
 import textwrap
-from typing import Any, Dict, Iterable, List
-from urllib.request import urlopen
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
 
+from vega_datasets import (
+    backends,
+    batch,
+    database,
+    parallel,
+    spatial,
+    store,
+    synthetic,
+    timeseries,
+)
+from vega_datasets.concurrency import FileLock, single_flight
+
 # This is the tag in http://github.com/vega/vega-datasets from
 # which the datasets in this repository are sourced.
 SOURCE_TAG = "v1.29.0"
@@ -40,6 +53,35 @@ def _load_dataset_info() -> Dict[str, Dict[str, Any]]:
     return info
 
 
+def _to_datetime(values: pd.Series, fmt: str) -> pd.Series:
+    """Convert a column to datetimes using a known format string.
+
+    Numeric columns are interpreted as epoch milliseconds. If any value does
+    not match ``fmt``, this falls back to pandas' format inference and warns.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values, unit="ms")
+    try:
+        return pd.to_datetime(values, format=fmt)
+    except (ValueError, TypeError):
+        warnings.warn(
+            "Column {0!r} does not match date format {1!r}; "
+            "falling back to format inference.".format(values.name, fmt)
+        )
+        return pd.to_datetime(values)
+
+
+def _index_to_datetime(index: pd.Index, name: str, fmt: str) -> pd.Index:
+    """Convert the index level ``name`` to datetimes, as in _to_datetime"""
+    if isinstance(index, pd.MultiIndex):
+        level = index.names.index(name)
+        values = _to_datetime(pd.Series(index.levels[level], name=name), fmt)
+        return index.set_levels(pd.Index(values), level=level)
+    return pd.Index(_to_datetime(pd.Series(index, name=name), fmt), name=name)
+
+
 class Dataset(object):
     """Class to load a particular dataset by name"""
 
@@ -94,10 +136,19 @@ class Dataset(object):
     _reference_info = """
     For information on this dataset, see https://github.com/vega/vega-datasets/
     """
-    base_url = "https://cdn.jsdelivr.net/npm/vega-datasets@" + SOURCE_TAG + "/data/"
+    _base_url_template = "https://cdn.jsdelivr.net/npm/vega-datasets@{tag}/data/"
+    base_url = _base_url_template.format(tag=SOURCE_TAG)
     _dataset_info = _load_dataset_info()
     _pd_read_kwds = {}  # type: Dict[str, Any]
+    _date_formats = {}  # type: Dict[str, str]
+    _sql_indexes = []  # type: List[database.Index]
+    _values_cache = {}  # type: Dict[Tuple[str, str, bool], bytes]
+    _coordinates = None  # type: Optional[Tuple[str, str]]
+    _spatial_cache = {}  # type: Dict[Tuple[str, str, bool], spatial.SpatialIndex]
+    _time_column = None  # type: Optional[str]
+    _time_cache = {}  # type: Dict[Tuple[str, str, bool, str], timeseries.TimeIndex]
     _return_type = pd.DataFrame
+    default_backend = "pandas"
 
     @classmethod
     def init(cls, name: str) -> "Dataset":
@@ -169,9 +220,63 @@ class Dataset(object):
         )
 
     @classmethod
-    def list_datasets(cls) -> List[str]:
-        """Return a list of names of available datasets"""
-        return sorted(cls._dataset_info.keys())
+    def list_datasets(cls, details: bool = False, remote: bool = False) -> List[Any]:
+        """Return a list of names of available datasets
+
+        If ``details`` is True, return a list of dictionaries with the
+        metadata of each dataset instead (see ``info()``, including its
+        ``remote`` argument).
+        """
+        names = sorted(cls._dataset_info.keys())
+        if details:
+            return [cls._metadata(name, remote) for name in names]
+        return names
+
+    @classmethod
+    def _metadata(cls, name: str, remote: bool = False) -> Dict[str, Any]:
+        info = cls._infodict(name)
+        columns = None
+        if "columns" in info:
+            columns = dict(zip(info["columns"], info["dtypes"]))
+        size, sha256 = info.get("size"), info.get("sha256")
+        if sha256 is None and remote:
+            # not recorded when the package was built: use the file listing
+            # of the release, which the dataset store fetches once per tag
+            entry = store.get_store().manifest(SOURCE_TAG).get(info["filename"], {})
+            size, sha256 = entry.get("size"), entry.get("sha256")
+        return {
+            "name": name,
+            "filename": info["filename"],
+            "format": info["format"],
+            "url": cls.base_url + info["filename"],
+            "is_local": info["is_local"],
+            "size": size,
+            "sha256": sha256,
+            "rows": info.get("rows"),
+            "columns": columns,
+        }
+
+    def info(self, remote: bool = False) -> Dict[str, Any]:
+        """Return metadata about the dataset without loading it
+
+        Parameters
+        ----------
+        remote : boolean
+            If True, and the size and hash were not recorded when the
+            package was built, take them from the file listing of the
+            release. The listing is fetched over the network once, and kept
+            in the dataset store (see ``vega_datasets.store``).
+
+        Returns
+        -------
+        info : dict
+            The dataset ``name``, ``filename``, ``format``, ``url`` and
+            ``is_local`` flag, along with its ``size`` in bytes, ``sha256``
+            hash, number of ``rows`` and ``columns`` (a mapping of column
+            name to dtype). Values that were not recorded (or do not apply,
+            such as rows for images) are None.
+        """
+        return self._metadata(self.name, remote)
 
     @classmethod
     def list_local_datasets(cls) -> List[str]:
@@ -180,7 +285,7 @@ class Dataset(object):
         )
 
     @classmethod
-    def _infodict(cls, name: str) -> Dict[str, str]:
+    def _infodict(cls, name: str) -> Dict[str, Any]:
         """load the info dictionary for the given name"""
         info = cls._dataset_info.get(name, None)
         if info is None:
@@ -191,7 +296,7 @@ class Dataset(object):
             )
         return info
 
-    def raw(self, use_local: bool = True) -> bytes:
+    def raw(self, use_local: bool = True, tag: Optional[str] = None) -> bytes:
         """Load the raw dataset from remote URL or local file
 
         Parameters
@@ -200,8 +305,16 @@ class Dataset(object):
             If True (default), then attempt to load the dataset locally. If
             False or if the dataset is not available locally, then load the
             data from an external URL.
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``; bundled files are only used for that tag.
+
+        Downloaded files are kept in a content-addressed store (see
+        ``vega_datasets.store``) shared by all tags and package versions.
         """
-        if use_local and self.is_local:
+        if tag is None:
+            tag = SOURCE_TAG
+        if use_local and self.is_local and tag == SOURCE_TAG:
             out = pkgutil.get_data("vega_datasets", self.pkg_filename)
             if out is not None:
                 return out
@@ -209,9 +322,20 @@ class Dataset(object):
                 "Cannot locate package path vega_datasets:{}".format(self.pkg_filename)
             )
         else:
-            return urlopen(self.url).read()
-
-    def __call__(self, use_local: bool = True, **kwargs) -> pd.DataFrame:
+            url = self._base_url_template.format(tag=tag) + self.filename
+            return store.get_store().get(tag, self.filename, url)
+
+    @single_flight
+    def __call__(
+        self,
+        use_local: bool = True,
+        backend: Optional[str] = None,
+        tag: Optional[str] = None,
+        workers: Optional[int] = None,
+        start: Any = None,
+        end: Any = None,
+        **kwargs
+    ) -> Any:
         """Load and parse the dataset from remote URL or local file
 
         Parameters
@@ -220,28 +344,62 @@ class Dataset(object):
             If True (default), then attempt to load the dataset locally. If
             False or if the dataset is not available locally, then load the
             data from an external URL.
+        backend : string, optional
+            One of {'pandas', 'arrow', 'polars'}. If not specified, use
+            ``Dataset.default_backend`` (see ``data.set_backend()``).
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+        workers : int, optional
+            If greater than one, parse CSV and TSV data with the pandas
+            backend in this many processes. Small files are always parsed
+            in a single process; the arrow and polars backends are already
+            multi-threaded and ignore this.
+        start, end : optional
+            For time-series datasets, return only the rows with
+            ``start <= date <= end``. Either bound may be omitted, and may be
+            anything accepted by ``pd.Timestamp``. The range is looked up in
+            a sorted index over a cached copy of the dataset (see
+            ``time_index()``).
         **kwargs :
             additional keyword arguments are passed to data parser (usually
             pd.read_csv or pd.read_json, depending on the format of the data
-            source)
+            source and the backend)
 
         Returns
         -------
         data :
             parsed data
         """
-        datasource = BytesIO(self.raw(use_local=use_local))
+        backend = self._get_backend(backend)
+        if start is not None or end is not None:
+            if kwargs:
+                # custom parser arguments: index this load only
+                column = self._get_time_column()
+                data = self(use_local=use_local, backend=backend, tag=tag, **kwargs)
+                index = timeseries.TimeIndex(data, column, backend)
+            else:
+                index = self.time_index(use_local=use_local, backend=backend, tag=tag)
+            return index.slice(start, end)
+        if backend != "pandas":
+            raw = self.raw(use_local=use_local, tag=tag)
+            return self._read_backend(raw, backend, **kwargs)
+
+        raw = self.raw(use_local=use_local, tag=tag)
 
         kwds = self._pd_read_kwds.copy()
         kwds.update(kwargs)
+        date_formats = self._split_date_formats(kwds, kwargs)
 
         if self.format == "json":
-            return pd.read_json(datasource, **kwds)
-        elif self.format == "csv":
-            return pd.read_csv(datasource, **kwds)
-        elif self.format == "tsv":
-            kwds.setdefault("sep", "\t")
-            return pd.read_csv(datasource, **kwds)
+            data = pd.read_json(BytesIO(raw), **kwds)
+        elif self.format in ("csv", "tsv"):
+            if self.format == "tsv":
+                kwds.setdefault("sep", "\t")
+            if workers is not None and workers > 1:
+                data = parallel.read_csv(raw, workers, **kwds)
+            else:
+                data = pd.read_csv(BytesIO(raw), **kwds)
         else:
             raise ValueError(
                 "Unrecognized file format: {0}. "
@@ -249,6 +407,363 @@ class Dataset(object):
                 "".format(self.format)
             )
 
+        for col, fmt in date_formats.items():
+            if col in data.columns:
+                data[col] = _to_datetime(data[col], fmt)
+            elif col in data.index.names:
+                # moved to the index with index_col
+                data.index = _index_to_datetime(data.index, col, fmt)
+        return data
+
+    def _split_date_formats(
+        self, kwds: Dict[str, Any], user_kwds: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """Remove columns with a registered date format from the parser
+        keywords, and return the formats to apply after parsing.
+
+        If the user passes their own ``parse_dates`` or ``convert_dates``,
+        the registry is bypassed and pandas handles the dates as requested.
+        """
+        if not self._date_formats:
+            return {}
+        if "parse_dates" in user_kwds or "convert_dates" in user_kwds:
+            return {}
+        key = "convert_dates" if self.format == "json" else "parse_dates"
+        kwds[key] = [col for col in kwds.get(key, []) if col not in self._date_formats]
+        if self.format == "json":
+            kwds.setdefault("keep_default_dates", False)
+        return dict(self._date_formats)
+
+    def _get_backend(self, backend: Optional[str]) -> str:
+        if backend is None:
+            backend = self.default_backend
+        return backends.validate_backend(backend)
+
+    def _backend_columns(self) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Translate the pandas read keywords into the date columns (with
+        their formats, if registered) and string columns of the dataset."""
+        date_formats = {}  # type: Dict[str, Optional[str]]
+        for key in ["parse_dates", "convert_dates"]:
+            for col in self._pd_read_kwds.get(key, []):
+                date_formats[col] = None
+        date_formats.update(self._date_formats)
+        string_columns = [
+            col
+            for col, dtype in self._pd_read_kwds.get("dtype", {}).items()
+            if dtype in ("object", str)
+        ]
+        return date_formats, string_columns
+
+    def _read_backend(self, raw: bytes, backend: str, **kwargs) -> Any:
+        """Parse raw bytes with the arrow or polars backend"""
+        date_formats, string_columns = self._backend_columns()
+        reader = backends.read_arrow if backend == "arrow" else backends.read_polars
+        return reader(raw, self.format, date_formats, string_columns, **kwargs)
+
+    def _is_table(self) -> bool:
+        """Whether the dataset is a table of records, rather than e.g. a
+        TopoJSON, GeoJSON or grid file"""
+        if self._return_type is not pd.DataFrame:
+            return False
+        if self.format == "json":
+            return self.raw().lstrip()[:1] == b"["
+        return self.format in ("csv", "tsv")
+
+    def materialize(
+        self,
+        path: Optional[str] = None,
+        indexes: Optional[Iterable[database.Index]] = None,
+        **kwargs
+    ) -> None:
+        """Write the dataset into a local SQLite database
+
+        Parameters
+        ----------
+        path : string, optional
+            The database file; by default, ``datasets.sqlite`` within the
+            dataset store (see ``vega_datasets.store``).
+        indexes : list, optional
+            Column names (or tuples of column names) to index. Defaults to
+            the indexes declared for the dataset.
+        **kwargs :
+            additional keyword arguments are passed to the dataset loader
+        """
+        if indexes is None:
+            indexes = self._sql_indexes
+        with FileLock(database.lock_path(path, self.name)):
+            self._materialize(path, indexes, **kwargs)
+
+    def _materialize(
+        self, path: Optional[str], indexes: Iterable[database.Index], **kwargs
+    ) -> None:
+        """Write the table; the caller holds the lock at database.lock_path"""
+        if not self._is_table():
+            raise ValueError(
+                "Dataset {0} cannot be stored as a table".format(self.name)
+            )
+        frame = self(backend="pandas", **kwargs)
+        with closing(database.connect(path)) as conn:
+            database.write_table(conn, self.name, SOURCE_TAG, frame, indexes)
+
+    def query(
+        self,
+        where: Optional[str] = None,
+        params: Iterable[Any] = (),
+        columns: Optional[List[str]] = None,
+        path: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Select rows of the dataset from the local SQLite database
+
+        The dataset is materialized on first use (see ``materialize()``).
+
+        Parameters
+        ----------
+        where : string, optional
+            An SQL expression to filter rows, e.g. ``"state = ?"``.
+        params : sequence, optional
+            Values bound to ``?`` placeholders in ``where``.
+        columns : list, optional
+            The columns to return; by default all columns.
+        path : string, optional
+            The database file, as in ``materialize()``.
+
+        Returns
+        -------
+        data : DataFrame
+            the selected rows
+        """
+        with closing(database.connect(path)) as conn:
+            if not database.is_materialized(conn, self.name, SOURCE_TAG):
+                with FileLock(database.lock_path(path, self.name)):
+                    # another process may have materialized it meanwhile
+                    if not database.is_materialized(conn, self.name, SOURCE_TAG):
+                        self._materialize(path, self._sql_indexes)
+            return database.read_table(
+                conn, self.name, columns=columns, where=where, params=list(params)
+            )
+
+    def synthesize(
+        self,
+        n_rows: int,
+        seed: Optional[int] = None,
+        path: Optional[str] = None,
+        chunk_size: int = synthetic.DEFAULT_CHUNK_SIZE,
+        **kwargs
+    ) -> Optional[pd.DataFrame]:
+        """Generate a synthetic version of the dataset with ``n_rows`` rows
+
+        Column distributions, categories and date ranges are learned from
+        the real data (see ``vega_datasets.synthetic``), and each column is
+        sampled independently.
+
+        Parameters
+        ----------
+        n_rows : int
+            The number of rows to generate.
+        seed : int, optional
+            Seed for the random number generator.
+        path : string, optional
+            If given, stream the rows to this file in chunks rather than
+            returning them. The file format is chosen from the extension:
+            ``.csv`` or ``.parquet`` (which requires pyarrow).
+        chunk_size : int, optional
+            The number of rows generated at a time.
+        **kwargs :
+            additional keyword arguments are passed to the dataset loader
+
+        Returns
+        -------
+        data : DataFrame or None
+            the synthetic data, or None if ``path`` is given
+        """
+        if self._return_type is not pd.DataFrame:
+            raise ValueError(
+                "Dataset {0} cannot be synthesized as a table".format(self.name)
+            )
+        model = synthetic.fit(self(backend="pandas", **kwargs))
+        chunks = model.generate(n_rows, seed=seed, chunk_size=chunk_size)
+        if path is None:
+            return pd.concat(list(chunks))
+        if path.endswith(".csv"):
+            synthetic.write_csv(chunks, path)
+        elif path.endswith(".parquet"):
+            synthetic.write_parquet(chunks, path)
+        else:
+            raise ValueError(
+                "Unrecognized file extension: {0}. "
+                "Valid options are ['.csv', '.parquet'].".format(path)
+            )
+        return None
+
+    @single_flight
+    def to_values(self, use_local: bool = True, tag: Optional[str] = None) -> bytes:
+        """Return the dataset as a compact JSON array of records
+
+        This is the form Vega-Lite expects for inline data values. JSON
+        datasets that are already lists of records are returned as-is,
+        without parsing. CSV and TSV datasets are parsed once, converted,
+        and cached for the rest of the session; their date columns are
+        written as ISO 8601 strings (e.g. ``"2010-01-01T00:00:00"``), which
+        Vega parses as local time.
+
+        Parameters
+        ----------
+        use_local : boolean
+            If True (default), then attempt to load the dataset locally. If
+            False or if the dataset is not available locally, then load the
+            data from an external URL.
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+
+        Returns
+        -------
+        values : bytes
+            UTF-8 encoded JSON
+        """
+        key = (self.name, tag or SOURCE_TAG, use_local)
+        values = self._values_cache.get(key)
+        if values is not None:
+            return values
+        if self.format == "json":
+            values = self.raw(use_local=use_local, tag=tag)
+            if values.lstrip()[:1] != b"[":
+                raise ValueError(
+                    "Dataset {0} is not a list of records".format(self.name)
+                )
+        elif self.format in ("csv", "tsv"):
+            df = self(use_local=use_local, tag=tag, backend="pandas")
+            values = df.to_json(
+                orient="records", date_format="iso", date_unit="s"
+            ).encode()
+        else:
+            raise ValueError(
+                "Dataset {0} with format {1} cannot be converted to values"
+                "".format(self.name, self.format)
+            )
+        self._values_cache[key] = values
+        return values
+
+    def to_vega_data(
+        self, inline: bool = True, use_local: bool = True, tag: Optional[str] = None
+    ) -> bytes:
+        """Return a serialized Vega-Lite data definition for the dataset
+
+        The result can be spliced directly into a serialized chart
+        specification, or passed to ``json.loads`` to get a dictionary.
+
+        Parameters
+        ----------
+        inline : boolean
+            If True (default), embed the records as ``values`` (see
+            ``to_values()``). Otherwise, refer to the dataset ``url``.
+        use_local : boolean
+            If True (default), then attempt to load the dataset locally.
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+
+        Returns
+        -------
+        data : bytes
+            UTF-8 encoded JSON object
+        """
+        if inline:
+            return b'{"values":' + self.to_values(use_local=use_local, tag=tag) + b"}"
+        url = self._base_url_template.format(tag=tag or SOURCE_TAG) + self.filename
+        return json.dumps(
+            {"url": url, "format": {"type": self.format}}, separators=(",", ":")
+        ).encode()
+
+    def _spatial_frame(self, use_local: bool, tag: Optional[str]) -> pd.DataFrame:
+        """Load the rows to index, with the columns named in _coordinates"""
+        return self(use_local=use_local, tag=tag, backend="pandas")
+
+    @single_flight
+    def spatial_index(
+        self, use_local: bool = True, tag: Optional[str] = None
+    ) -> spatial.SpatialIndex:
+        """Return a spatial index over the dataset's latitude and longitude
+
+        The index is built on first use and cached for the rest of the
+        session. Its ``nearest(lat, lon, k)`` and ``within(lat, lon,
+        radius_km)`` methods return row positions and distances in km;
+        ``index.frame.iloc[positions]`` gives the matching rows.
+
+            >>> from vega_datasets import data
+            >>> index = data.airports.spatial_index()
+            >>> positions, distances = index.nearest(47.6, -122.3, k=3)
+            >>> index.frame.iloc[positions]  # doctest: +SKIP
+
+        Parameters
+        ----------
+        use_local : boolean
+            If True (default), then attempt to load the dataset locally. If
+            False or if the dataset is not available locally, then load the
+            data from an external URL.
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+        """
+        if self._coordinates is None:
+            raise ValueError(
+                "Dataset {0} has no latitude/longitude columns".format(self.name)
+            )
+        key = (self.name, tag or SOURCE_TAG, use_local)
+        index = self._spatial_cache.get(key)
+        if index is None:
+            frame = self._spatial_frame(use_local, tag)
+            lat, lon = self._coordinates
+            index = spatial.SpatialIndex(frame[lat], frame[lon], frame=frame)
+            self._spatial_cache[key] = index
+        return index
+
+    def _get_time_column(self) -> str:
+        if self._time_column is None:
+            raise ValueError("Dataset {0} is not a time series".format(self.name))
+        return self._time_column
+
+    @single_flight
+    def time_index(
+        self,
+        use_local: bool = True,
+        backend: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> timeseries.TimeIndex:
+        """Return a sorted index over the dataset's date column
+
+        The dataset is parsed and indexed on first use and cached for the
+        rest of the session, so that ``start``/``end`` range loads only do
+        a binary search and copy the selected rows.
+
+            >>> from vega_datasets import data
+            >>> index = data.stocks.time_index()
+            >>> len(index.slice("2008-09-01", "2008-09-30"))
+            5
+
+        Parameters
+        ----------
+        use_local : boolean
+            If True (default), then attempt to load the dataset locally. If
+            False or if the dataset is not available locally, then load the
+            data from an external URL.
+        backend : string, optional
+            One of {'pandas', 'arrow', 'polars'}. If not specified, use
+            ``Dataset.default_backend`` (see ``data.set_backend()``).
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+        """
+        column = self._get_time_column()
+        backend = self._get_backend(backend)
+        key = (self.name, tag or SOURCE_TAG, use_local, backend)
+        index = self._time_cache.get(key)
+        if index is None:
+            data = self(use_local=use_local, backend=backend, tag=tag)
+            index = timeseries.TimeIndex(data, column, backend)
+            self._time_cache[key] = index
+        return index
+
     @property
     def filepath(self) -> str:
         if not self.is_local:
@@ -282,8 +797,11 @@ class Stocks(Dataset):
         2000-03-01  33.95  67.00   NaN  106.11  43.22
     """
     _pd_read_kwds = {"parse_dates": ["date"]}
+    _date_formats = {"date": "%b %d %Y"}
+    _time_column = "date"
 
-    def __call__(self, pivoted=False, use_local=True, **kwargs):
+    @single_flight
+    def __call__(self, pivoted=False, use_local=True, backend=None, tag=None, **kwargs):
         """Load and parse the dataset from remote URL or local file
 
         Parameters
@@ -294,6 +812,15 @@ class Stocks(Dataset):
             If True (default), then attempt to load the dataset locally. If
             False or if the dataset is not available locally, then load the
             data from an external URL.
+        backend : string, optional
+            One of {'pandas', 'arrow', 'polars'}. If not specified, use
+            ``Dataset.default_backend`` (see ``data.set_backend()``).
+        tag : string, optional
+            The vega-datasets release tag to load the dataset from. Defaults
+            to ``SOURCE_TAG``.
+        start, end : optional
+            Return only the rows with ``start <= date <= end`` (see
+            ``Dataset.__call__``).
         **kwargs :
             additional keyword arguments are passed to data parser (usually
             pd.read_csv or pd.read_json, depending on the format of the data
@@ -305,15 +832,27 @@ class Stocks(Dataset):
             parsed data
         """
         __doc__ = super(Stocks, self).__call__.__doc__  # noqa:F841
-        data = super(Stocks, self).__call__(use_local=use_local, **kwargs)
-        if pivoted:
+        backend = self._get_backend(backend)
+        data = super(Stocks, self).__call__(
+            use_local=use_local, backend=backend, tag=tag, **kwargs
+        )
+        if pivoted and backend == "pandas":
             data = data.pivot(index="date", columns="symbol", values="price")
+        elif pivoted:
+            data = backends.pivot(data, backend, "date", "symbol", "price")
         return data
 
 
+class Airports(Dataset):
+    name = "airports"
+    _sql_indexes = ["iata", "state"]
+    _coordinates = ("latitude", "longitude")
+
+
 class Cars(Dataset):
     name = "cars"
     _pd_read_kwds = {"convert_dates": ["Year"]}
+    _date_formats = {"Year": "%Y-%m-%d"}
 
 
 class Climate(Dataset):
@@ -321,19 +860,82 @@ class Climate(Dataset):
     _pd_read_kwds = {"convert_dates": ["DATE"]}
 
 
+class CO2Concentration(Dataset):
+    name = "co2-concentration"
+    _pd_read_kwds = {"parse_dates": ["Date"]}
+    _time_column = "Date"
+
+
+class Crimea(Dataset):
+    name = "crimea"
+    _pd_read_kwds = {"convert_dates": ["date"]}
+    _date_formats = {"date": "%Y-%m-%d"}
+
+
+class Earthquakes(Dataset):
+    name = "earthquakes"
+    _coordinates = ("latitude", "longitude")
+
+    def _spatial_frame(self, use_local, tag):
+        # GeoJSON features: one row per feature, with its properties
+        features = json.loads(self.raw(use_local=use_local, tag=tag).decode())
+        features = features["features"]
+        frame = pd.DataFrame.from_records(
+            [feature.get("properties") or {} for feature in features]
+        )
+        coords = [feature["geometry"]["coordinates"] for feature in features]
+        frame["longitude"] = [c[0] for c in coords]
+        frame["latitude"] = [c[1] for c in coords]
+        return frame
+
+
+class Flights2k(Dataset):
+    name = "flights-2k"
+    _date_formats = {"date": "%Y/%m/%d %H:%M"}
+
+
+class Flights5k(Dataset):
+    name = "flights-5k"
+    _date_formats = {"date": "%Y/%m/%d %H:%M"}
+
+
+class Flights10k(Dataset):
+    name = "flights-10k"
+    _date_formats = {"date": "%Y/%m/%d %H:%M"}
+
+
+class Flights20k(Dataset):
+    name = "flights-20k"
+    _date_formats = {"date": "%Y/%m/%d %H:%M"}
+
+
+class Flights3m(Dataset):
+    name = "flights-3m"
+    _sql_indexes = ["origin", "destination"]
+
+
 class Github(Dataset):
     name = "github"
     _pd_read_kwds = {"parse_dates": ["time"]}
+    _time_column = "time"
 
 
 class IowaElectricity(Dataset):
     name = "iowa-electricity"
     _pd_read_kwds = {"parse_dates": ["year"]}
+    _date_formats = {"year": "%Y-%m-%d"}
 
 
 class LARiots(Dataset):
     name = "la-riots"
     _pd_read_kwds = {"parse_dates": ["death_date"]}
+    _date_formats = {"death_date": "%Y-%m-%d"}
+    _coordinates = ("latitude", "longitude")
+
+
+class LondonCentroids(Dataset):
+    name = "londonCentroids"
+    _coordinates = ("cy", "cx")
 
 
 class Miserables(Dataset):
@@ -344,32 +946,58 @@ class Miserables(Dataset):
     both of which are returned from this function.
     """
 
-    def __call__(self, use_local=True, **kwargs):
+    @single_flight
+    def __call__(self, use_local=True, backend=None, tag=None, **kwargs):
         __doc__ = super(Miserables, self).__call__.__doc__  # noqa:F841
-        dct = json.loads(self.raw(use_local=use_local).decode(), **kwargs)
+        backend = self._get_backend(backend)
+        dct = json.loads(self.raw(use_local=use_local, tag=tag).decode(), **kwargs)
+        if backend != "pandas":
+            return (
+                backends.from_records(dct["nodes"], backend),
+                backends.from_records(dct["links"], backend),
+            )
         nodes = pd.DataFrame.from_records(dct["nodes"], index="index")
         links = pd.DataFrame.from_records(dct["links"])
         return nodes, links
 
 
+class Movies(Dataset):
+    name = "movies"
+    _sql_indexes = ["Major Genre"]
+
+
+class OHLC(Dataset):
+    name = "ohlc"
+    _pd_read_kwds = {"convert_dates": ["date"]}
+    _date_formats = {"date": "%Y-%m-%d"}
+
+
 class SeattleTemps(Dataset):
     name = "seattle-temps"
     _pd_read_kwds = {"parse_dates": ["date"]}
+    _date_formats = {"date": "%Y/%m/%d %H:%M"}
+    _time_column = "date"
 
 
 class SeattleWeather(Dataset):
     name = "seattle-weather"
     _pd_read_kwds = {"parse_dates": ["date"]}
+    _date_formats = {"date": "%Y/%m/%d"}
+    _time_column = "date"
 
 
 class SFTemps(Dataset):
     name = "sf-temps"
     _pd_read_kwds = {"parse_dates": ["date"]}
+    _date_formats = {"date": "%Y/%m/%d %H:%M:%S"}
+    _time_column = "date"
 
 
 class Sp500(Dataset):
     name = "sp500"
     _pd_read_kwds = {"parse_dates": ["date"]}
+    _date_formats = {"date": "%b %d %Y"}
+    _time_column = "date"
 
 
 class UnemploymentAcrossIndustries(Dataset):
@@ -377,6 +1005,11 @@ class UnemploymentAcrossIndustries(Dataset):
     _pd_read_kwds = {"convert_dates": ["date"]}
 
 
+class USStateCapitals(Dataset):
+    name = "us-state-capitals"
+    _coordinates = ("lat", "lon")
+
+
 class US_10M(Dataset):
     name = "us-10m"
     _return_type = dict
@@ -386,9 +1019,12 @@ class US_10M(Dataset):
     a simple Python dictionary.
     """
 
-    def __call__(self, use_local=True, **kwargs):
+    @single_flight
+    def __call__(self, use_local=True, backend=None, tag=None, **kwargs):
         __doc__ = super(US_10M, self).__call__.__doc__  # noqa:F841
-        return json.loads(self.raw(use_local=use_local).decode(), **kwargs)
+        # the result is a dictionary whichever backend is requested
+        self._get_backend(backend)
+        return json.loads(self.raw(use_local=use_local, tag=tag).decode(), **kwargs)
 
 
 class World_110M(Dataset):
@@ -400,14 +1036,19 @@ class World_110M(Dataset):
     a simple Python dictionary.
     """
 
-    def __call__(self, use_local=True, **kwargs):
+    @single_flight
+    def __call__(self, use_local=True, backend=None, tag=None, **kwargs):
         __doc__ = super(World_110M, self).__call__.__doc__  # noqa:F841
-        return json.loads(self.raw(use_local=use_local).decode(), **kwargs)
+        # the result is a dictionary whichever backend is requested
+        self._get_backend(backend)
+        return json.loads(self.raw(use_local=use_local, tag=tag).decode(), **kwargs)
 
 
 class ZIPCodes(Dataset):
     name = "zipcodes"
     _pd_read_kwds = {"dtype": {"zip_code": "object"}}
+    _sql_indexes = ["zip_code", "state"]
+    _coordinates = ("latitude", "longitude")
 
 
 class DataLoader(object):
@@ -429,11 +1070,17 @@ class DataLoader(object):
     -------------------
     return_raw : boolean
         If True, then return the raw string or bytes.
-        If False (default), then return a pandas dataframe.
+        If False (default), then return a dataframe.
+    backend : string
+        One of {'pandas', 'arrow', 'polars'}; the default is 'pandas', and
+        can be changed with ``data.set_backend()``.
     use_local : boolean
         If True (default), then attempt to load the dataset locally. If
         False or if the dataset is not available locally, then load the
         data from an external URL.
+    tag : string
+        The vega-datasets release tag to load the dataset from. Defaults
+        to ``SOURCE_TAG``.
     **kwargs :
         additional keyword arguments are passed to the pandas parsing function,
         either ``read_csv()`` or ``read_json()`` depending on the data format.
@@ -441,8 +1088,94 @@ class DataLoader(object):
 
     _datasets = {name.replace("-", "_"): name for name in Dataset.list_datasets()}
 
-    def list_datasets(self):
-        return Dataset.list_datasets()
+    def list_datasets(self, details=False, remote=False):
+        return Dataset.list_datasets(details=details, remote=remote)
+
+    def set_backend(self, backend):
+        """Set the default backend used to parse datasets.
+
+        Parameters
+        ----------
+        backend : string
+            One of {'pandas', 'arrow', 'polars'}.
+        """
+        Dataset.default_backend = backends.validate_backend(backend)
+
+    def materialize(self, names=None, path=None, indexes=None):
+        """Write datasets into a local SQLite database
+
+        Parameters
+        ----------
+        names : list, optional
+            The datasets to store. By default, all datasets that are tables
+            of records (CSV and TSV files, and JSON arrays of records).
+        path : string, optional
+            The database file; see ``Dataset.materialize()``.
+        indexes : dict, optional
+            Mapping of dataset name to the columns to index, overriding the
+            defaults declared for each dataset.
+        """
+        if names is None:
+            names = [
+                name
+                for name in self.list_datasets()
+                if getattr(self, name.replace("-", "_"))._is_table()
+            ]
+        indexes = indexes or {}
+        for name in names:
+            loader = getattr(self, name.replace("-", "_"))
+            loader.materialize(path=path, indexes=indexes.get(name))
+
+    def query(self, sql, params=(), path=None):
+        """Run an SQL query against the local SQLite database
+
+        Tables are named after the datasets, with dashes replaced by
+        underscores; only datasets stored with ``materialize()`` (or
+        previously queried) are available.
+
+        Parameters
+        ----------
+        sql : string
+            The query, which may contain ``?`` placeholders.
+        params : sequence, optional
+            Values bound to the placeholders.
+        path : string, optional
+            The database file; see ``Dataset.materialize()``.
+
+        Returns
+        -------
+        data : DataFrame
+            the query result
+        """
+        with closing(database.connect(path)) as conn:
+            return database.query(conn, sql, params)
+
+    def load_many(self, names, workers=None, **kwargs):
+        """Load several datasets in parallel processes
+
+        Parameters
+        ----------
+        names : list
+            The names of the datasets to load.
+        workers : int, optional
+            The number of processes to use; by default, one per CPU. With a
+            single worker, the datasets are loaded in this process.
+        **kwargs :
+            additional keyword arguments are passed to each dataset loader
+
+        Returns
+        -------
+        data : dict
+            mapping of each name to its loaded dataset
+        """
+        datasets = {name: getattr(self, name.replace("-", "_")).name for name in names}
+        results = batch.load_many(
+            sorted(set(datasets.values())),
+            Dataset.default_backend,
+            workers=workers,
+            **kwargs
+        )
+        return {name: results[dataset] for name, dataset in datasets.items()}
 
     def __call__(self, name, return_raw=False, use_local=True, **kwargs):
         loader = getattr(self, name.replace("-", "_"))
@@ -464,7 +1197,12 @@ class DataLoader(object):
 class LocalDataLoader(DataLoader):
     _datasets = {name.replace("-", "_"): name for name in Dataset.list_local_datasets()}
 
-    def list_datasets(self):
+    def list_datasets(self, details=False, remote=False):
+        if details:
+            return [
+                Dataset._metadata(name, remote)
+                for name in Dataset.list_local_datasets()
+            ]
         return Dataset.list_local_datasets()
 
     def __getattr__(self, dataset_name):
@@ -0,0 +1,155 @@
+"""Materialize datasets into a local SQLite database for indexed queries.
+
+Each dataset is stored in a table named after the dataset (with dashes
+replaced by underscores), using the column types that ``DataFrame.to_sql``
+derives from the pandas dtypes. The ``_vega_datasets_tables`` table records
+which source tag each table was built from.
+
+A table is written under a temporary name and swapped in within a single
+transaction, so readers never see it missing or partially written. Writers
+of the same table serialize on a :class:`~vega_datasets.concurrency.FileLock`
+(see :func:`lock_path`).
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from vega_datasets import store
+
+_META_TABLE = "_vega_datasets_tables"
+
+Index = Union[str, Sequence[str]]
+
+
+def default_path() -> str:
+    """Return the default database location, inside the dataset store."""
+    return os.path.join(store.default_cache_dir(), "datasets.sqlite")
+
+
+def lock_path(path: Optional[str], name: str) -> str:
+    """Return the lock file guarding writes of dataset ``name`` to the
+    database at ``path``."""
+    path = os.path.abspath(path or default_path())
+    dirname, filename = os.path.split(path)
+    return os.path.join(dirname, "locks", "{0}-{1}.lock".format(filename, name))
+
+
+def table_name(name: str) -> str:
+    return name.replace("-", "_")
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def connect(path: Optional[str] = None) -> sqlite3.Connection:
+    path = path or default_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS {0} (name TEXT PRIMARY KEY, tag TEXT)"
+        "".format(_META_TABLE)
+    )
+    return conn
+
+
+def is_materialized(conn: sqlite3.Connection, name: str, tag: str) -> bool:
+    row = conn.execute(
+        "SELECT tag FROM {0} WHERE name = ?".format(_META_TABLE), (name,)
+    ).fetchone()
+    return row is not None and row[0] == tag
+
+
+def write_table(
+    conn: sqlite3.Connection,
+    name: str,
+    tag: str,
+    frame: pd.DataFrame,
+    indexes: Iterable[Index] = (),
+) -> None:
+    """Replace the table for dataset ``name`` with ``frame``, and create an
+    index for each column name (or sequence of column names) in ``indexes``.
+
+    Callers writing from several processes should hold the lock at
+    :func:`lock_path`.
+    """
+    table = table_name(name)
+    new_table = table + "__new"
+    frame = frame.copy()
+    for col in frame.columns[frame.dtypes == object]:
+        # nested JSON values cannot be bound as SQLite parameters
+        if frame[col].map(lambda v: isinstance(v, (list, dict))).any():
+            frame[col] = frame[col].map(
+                lambda v: json.dumps(v) if isinstance(v, (list, dict)) else v
+            )
+    frame.to_sql(new_table, conn, if_exists="replace", index=False)
+    conn.commit()
+
+    # swap the new table in within one explicit transaction: the sqlite3
+    # module would otherwise commit before DDL statements on Python < 3.6
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DROP TABLE IF EXISTS {0}".format(_quote(table)))
+            conn.execute(
+                "ALTER TABLE {0} RENAME TO {1}".format(_quote(new_table), _quote(table))
+            )
+            for cols in indexes:
+                cols = [cols] if isinstance(cols, str) else list(cols)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS {0} ON {1} ({2})".format(
+                        _quote("ix_{0}_{1}".format(table, "_".join(cols))),
+                        _quote(table),
+                        ", ".join(_quote(col) for col in cols),
+                    )
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO {0} VALUES (?, ?)".format(_META_TABLE),
+                (name, tag),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.isolation_level = isolation_level
+
+
+def _date_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    info = conn.execute("PRAGMA table_info({0})".format(_quote(table))).fetchall()
+    return [row[1] for row in info if row[2] == "TIMESTAMP"]
+
+
+def read_table(
+    conn: sqlite3.Connection,
+    name: str,
+    columns: Optional[Sequence[str]] = None,
+    where: Optional[str] = None,
+    params: Sequence[Any] = (),
+) -> pd.DataFrame:
+    """Select rows of the table for dataset ``name``.
+
+    ``where`` is an SQL expression, which may contain ``?`` placeholders
+    bound to ``params``. Date columns are returned as datetimes.
+    """
+    table = table_name(name)
+    select = "*" if columns is None else ", ".join(_quote(col) for col in columns)
+    sql = "SELECT {0} FROM {1}".format(select, _quote(table))
+    if where:
+        sql += " WHERE " + where
+    dates = _date_columns(conn, table)
+    if columns is not None:
+        dates = [col for col in dates if col in columns]
+    return pd.read_sql_query(sql, conn, params=tuple(params), parse_dates=dates)
+
+
+def query(
+    conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()
+) -> pd.DataFrame:
+    return pd.read_sql_query(sql, conn, params=tuple(params))
@@ -0,0 +1,96 @@
+"""Parallel parsing of CSV and TSV data across a pool of processes.
+
+The raw bytes are split into newline-aligned byte ranges, each range is
+parsed by ``pd.read_csv`` in a worker process together with the header
+line (unless column ``names`` are given), and the pieces are concatenated
+in order. Quoted fields containing newlines are not supported, which holds
+for all vega datasets.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+# Keywords that change which lines are rows; with these, the file cannot be
+# split independently of the parser, so it is parsed serially.
+_SERIAL_KWDS = {
+    "header",
+    "skiprows",
+    "skipfooter",
+    "nrows",
+    "chunksize",
+    "iterator",
+    "comment",
+}
+
+# Below this size, process startup costs more than parsing.
+MIN_CHUNK_SIZE = 1 << 20
+
+
+def split_ranges(raw: bytes, n_chunks: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """Split ``raw`` into at most ``n_chunks`` newline-aligned byte ranges.
+
+    Returns the end offset of the header line and a list of ``(start, stop)``
+    ranges covering the remaining bytes.
+    """
+    header_end = raw.find(b"\n") + 1 or len(raw)
+    body = len(raw) - header_end
+    step = max(-(-body // max(n_chunks, 1)), 1)
+    ranges = []
+    start = header_end
+    while start < len(raw):
+        stop = raw.find(b"\n", min(start + step, len(raw)) - 1) + 1 or len(raw)
+        ranges.append((start, stop))
+        start = stop
+    return header_end, ranges
+
+
+def _parse_range(header: bytes, body: bytes, kwds: Dict[str, Any]) -> pd.DataFrame:
+    return pd.read_csv(BytesIO(header + body), **kwds)
+
+
+def read_csv(raw: bytes, workers: int, **kwds) -> pd.DataFrame:
+    """Parse CSV bytes with ``pd.read_csv`` using up to ``workers`` processes.
+
+    Falls back to a single ``pd.read_csv`` call for small inputs, or when
+    ``kwds`` contain options that depend on line positions.
+    """
+    n_chunks = min(workers, len(raw) // MIN_CHUNK_SIZE)
+    if n_chunks <= 1 or _SERIAL_KWDS.intersection(kwds):
+        return pd.read_csv(BytesIO(raw), **kwds)
+
+    header_end, ranges = split_ranges(raw, n_chunks)
+    header = raw[:header_end]
+    bodies = [raw[start:stop] for start, stop in ranges]
+    if "names" in kwds:
+        # with explicit names the first line is a data row, not a header
+        bodies = [header + bodies[0]] + bodies[1:] if bodies else [header]
+        header = b""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_parse_range, header, body, kwds) for body in bodies]
+        chunks = [future.result() for future in futures]
+
+        # A column that is numeric in one chunk but strings in another would
+        # be parsed as strings throughout in a single pass: re-parse those
+        # chunks with the column read as object.
+        object_cols = {
+            col
+            for chunk in chunks
+            for col, dtype in chunk.dtypes.items()
+            if dtype == object
+        }
+        redo = {}
+        for i, chunk in enumerate(chunks):
+            cols = [c for c in object_cols if c in chunk and chunk[c].dtype != object]
+            if cols and chunk[cols].notna().any().any():
+                chunk_kwds = dict(kwds)
+                dtype = chunk_kwds.get("dtype", {})
+                if isinstance(dtype, dict):
+                    chunk_kwds["dtype"] = dict(dtype, **{col: object for col in cols})
+                    redo[i] = pool.submit(_parse_range, header, bodies[i], chunk_kwds)
+        for i, future in redo.items():
+            chunks[i] = future.result()
+
+    return pd.concat(chunks, ignore_index="index_col" not in kwds)
@@ -0,0 +1,165 @@
+"""Spatial index for nearest-neighbour and radius queries on point datasets.
+
+Points are bucketed into a regular latitude/longitude grid whose cell size
+is chosen from the point density, and stored in cell order so that each
+grid row maps to contiguous slices of one index array. A query only
+computes great-circle distances for the points in the cells overlapping
+its search box, using vectorized NumPy.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Kilometres per degree of latitude
+_KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180
+
+# Target average number of points per occupied cell
+_POINTS_PER_CELL = 8
+
+
+def haversine(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km from (lat, lon) to each of (lats, lons)"""
+    lat, lon = np.radians(lat), np.radians(lon)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = (
+        np.sin((lats - lat) / 2) ** 2
+        + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1)))
+
+
+class SpatialIndex(object):
+    """Grid index over latitude/longitude points.
+
+    Parameters
+    ----------
+    lat, lon : array_like
+        Coordinates of the points in degrees. Points with a missing
+        coordinate are not indexed.
+    frame : DataFrame, optional
+        The rows the points belong to, available as ``index.frame``.
+    """
+
+    def __init__(self, lat, lon, frame: Optional[pd.DataFrame] = None):
+        self.frame = frame
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        valid = np.flatnonzero(np.isfinite(self.lat) & np.isfinite(self.lon))
+
+        if len(valid):
+            self.lat0, self.lon0 = self.lat[valid].min(), self.lon[valid].min()
+            height = self.lat[valid].max() - self.lat0
+            width = self.lon[valid].max() - self.lon0
+        else:
+            self.lat0 = self.lon0 = height = width = 0.0
+        area = max(height * width, 1e-6)
+        self.cell = max(np.sqrt(area * _POINTS_PER_CELL / max(len(valid), 1)), 1e-3)
+        self.nrows = int(height // self.cell) + 1
+        self.ncols = int(width // self.cell) + 1
+
+        rows = ((self.lat[valid] - self.lat0) // self.cell).astype(int)
+        cols = ((self.lon[valid] - self.lon0) // self.cell).astype(int)
+        cells = rows * self.ncols + cols
+        order = np.argsort(cells, kind="stable")
+        self._points = valid[order]
+        self._starts = np.searchsorted(
+            cells[order], np.arange(self.nrows * self.ncols + 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _lon_ranges(self, lon: float, dlon: float) -> List[Tuple[int, int]]:
+        """Grid column ranges covering [lon - dlon, lon + dlon], with wrapping
+        at the antimeridian."""
+        if dlon >= 180:
+            return [(0, self.ncols - 1)]
+        ranges = []
+        for shift in (-360, 0, 360):
+            lo = (lon + shift - dlon - self.lon0) // self.cell
+            hi = (lon + shift + dlon - self.lon0) // self.cell
+            lo, hi = max(int(lo), 0), min(int(hi), self.ncols - 1)
+            if lo <= hi:
+                ranges.append((lo, hi))
+        return ranges
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Positions of all points in grid cells that may lie within
+        ``radius_km`` of (lat, lon)."""
+        dlat = radius_km / _KM_PER_DEGREE
+        row_lo = max(int((lat - dlat - self.lat0) // self.cell), 0)
+        row_hi = min(int((lat + dlat - self.lat0) // self.cell), self.nrows - 1)
+        if row_lo > row_hi:
+            return self._points[:0]
+        max_lat = min(abs(lat) + dlat, 90.0)
+        if max_lat >= 89.9:
+            dlon = 180.0
+        else:
+            dlon = dlat / np.cos(np.radians(max_lat))
+        slices = []
+        for lo, hi in self._lon_ranges(lon, dlon):
+            for row in range(row_lo, row_hi + 1):
+                start = self._starts[row * self.ncols + lo]
+                stop = self._starts[row * self.ncols + hi + 1]
+                if stop > start:
+                    slices.append(self._points[start:stop])
+        if not slices:
+            return self._points[:0]
+        return np.concatenate(slices) if len(slices) > 1 else slices[0]
+
+    def within(
+        self, lat: float, lon: float, radius_km: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find all points within ``radius_km`` of (lat, lon).
+
+        Returns
+        -------
+        positions, distances : ndarray
+            Row positions of the points (for ``frame.iloc``) and their
+            distances in km, sorted by distance.
+        """
+        candidates = self._candidates(lat, lon, radius_km)
+        distances = haversine(lat, lon, self.lat[candidates], self.lon[candidates])
+        mask = distances <= radius_km
+        candidates, distances = candidates[mask], distances[mask]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def nearest(
+        self, lat: float, lon: float, k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` points nearest to (lat, lon).
+
+        Returns
+        -------
+        positions, distances : ndarray
+            Row positions of the points (for ``frame.iloc``) and their
+            distances in km, sorted by distance.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return self._points[:0], np.zeros(0)
+        radius = self.cell * _KM_PER_DEGREE
+        while True:
+            if radius >= np.pi * EARTH_RADIUS_KM:
+                candidates = self._points
+            else:
+                candidates = self._candidates(lat, lon, radius)
+            if len(candidates) >= k:
+                distances = haversine(
+                    lat, lon, self.lat[candidates], self.lon[candidates]
+                )
+                part = np.argpartition(distances, k - 1)[:k]
+                kth = distances[part].max()
+                # all points within `radius` are candidates, so the result is
+                # exact once the k-th distance is inside the search radius
+                if kth <= radius or len(candidates) == len(self):
+                    order = part[np.argsort(distances[part], kind="stable")]
+                    return candidates[order], distances[order]
+                radius = kth
+            else:
+                radius *= 2
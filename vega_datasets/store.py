@@ -0,0 +1,228 @@
+"""Content-addressed on-disk store for downloaded datasets.
+
+Files are stored once per SHA-256 digest under ``<root>/blobs``, and each
+vega-datasets tag has a manifest under ``<root>/manifests`` mapping dataset
+filenames to their digest and size. Files that do not change between tags
+are therefore downloaded and stored only once, whichever package version
+requested them first.
+
+A manifest is ``complete`` once it has been seeded from the release's file
+listing; until then it only holds the files downloaded so far, and the
+listing is retried.
+
+If the store cannot be created or written (e.g. a read-only home
+directory), files are downloaded without caching, with a warning.
+"""
+
+import base64
+import errno
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from typing import Any, Dict, Optional, Tuple
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from vega_datasets.concurrency import FileLock
+
+# jsDelivr lists every file of an npm release along with its base64-encoded
+# SHA-256 hash and size.
+LISTING_URL = "https://data.jsdelivr.com/v1/package/npm/vega-datasets@{version}/flat"
+
+_CHUNK_SIZE = 1 << 16
+
+# Errors raised when the store directory cannot be created or written
+_UNWRITABLE_ERRNOS = (errno.EACCES, errno.EPERM, errno.EROFS, errno.ENOTDIR)
+
+
+def default_cache_dir() -> str:
+    """Return the store location: $VEGA_DATASETS_CACHE, or
+    ~/.cache/vega_datasets by default."""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "vega_datasets")
+    return os.environ.get("VEGA_DATASETS_CACHE", default)
+
+
+def _atomic_write(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class DatasetStore(object):
+    """Hash-addressed store of dataset files shared across source tags.
+
+    Parameters
+    ----------
+    root : string, optional
+        Directory of the store. Defaults to :func:`default_cache_dir`.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or default_cache_dir()
+        # tags whose listing could not be fetched by this store instance
+        self._unreachable = set()  # type: set
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def manifest_path(self, tag: str) -> str:
+        return os.path.join(self.root, "manifests", tag + ".json")
+
+    def lock_path(self, name: str) -> str:
+        return os.path.join(self.root, "locks", name + ".lock")
+
+    def manifest(self, tag: str) -> Dict[str, Dict[str, Any]]:
+        """Return the manifest for ``tag``: a mapping of dataset filename to
+        a dict with its ``sha256`` digest and ``size`` in bytes.
+
+        The manifest is seeded from the jsDelivr file listing. If the
+        listing cannot be reached, the files downloaded so far are returned,
+        and the listing is tried again by the next store instance (e.g. in
+        the next session).
+        """
+        complete, files = self._read_manifest(tag)
+        if complete or tag in self._unreachable:
+            return files
+        with FileLock(self.lock_path("manifest-" + tag)):
+            complete, files = self._read_manifest(tag)
+            if not complete:
+                remote = self._remote_manifest(tag)
+                if remote is None:
+                    self._unreachable.add(tag)
+                else:
+                    files.update(remote)
+                    self._save_manifest(tag, True, files)
+        return files
+
+    def _read_manifest(self, tag: str) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        """Return whether the manifest for ``tag`` is complete, and its
+        entries."""
+        path = self.manifest_path(tag)
+        if not os.path.exists(path):
+            return False, {}
+        with open(path) as f:
+            manifest = json.load(f)
+        return manifest["complete"], manifest["files"]
+
+    def _save_manifest(
+        self, tag: str, complete: bool, files: Dict[str, Dict[str, Any]]
+    ) -> None:
+        manifest = {"complete": complete, "files": files}
+        content = json.dumps(manifest, indent=2, sort_keys=True).encode()
+        _atomic_write(self.manifest_path(tag), content)
+
+    def _add_to_manifest(self, tag: str, filename: str, entry: Dict[str, Any]) -> None:
+        # re-read under the lock, so entries added by other processes survive
+        with FileLock(self.lock_path("manifest-" + tag)):
+            complete, files = self._read_manifest(tag)
+            files[filename] = entry
+            self._save_manifest(tag, complete, files)
+
+    def _remote_manifest(self, tag: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Fetch the manifest for ``tag`` from the jsDelivr file listing, or
+        return None if it cannot be reached."""
+        url = LISTING_URL.format(version=tag.lstrip("v"))
+        try:
+            listing = json.loads(urlopen(url, timeout=10).read().decode())
+        except (URLError, OSError, ValueError):
+            return None
+        manifest = {}
+        for entry in listing.get("files", []):
+            dirname, filename = os.path.split(entry["name"])
+            if dirname != "/data":
+                continue
+            manifest[filename] = {
+                "sha256": base64.b64decode(entry["hash"]).hex(),
+                "size": entry["size"],
+            }
+        return manifest
+
+    def get(self, tag: str, filename: str, url: str) -> bytes:
+        """Return the contents of ``filename`` at ``tag``, downloading it
+        from ``url`` only if no file with the same digest is stored.
+
+        Concurrent requests for the same file, from threads or processes,
+        wait on a file lock so that it is downloaded only once. If the store
+        cannot be written, the file is downloaded without caching.
+        """
+        try:
+            return self._get(tag, filename, url)
+        except OSError as err:
+            if isinstance(err, URLError) or err.errno not in _UNWRITABLE_ERRNOS:
+                raise
+            warnings.warn(
+                "Cannot write to the dataset store at {0} ({1}); downloading "
+                "{2} without caching.".format(self.root, err, url)
+            )
+        with urlopen(url) as response:
+            return response.read()
+
+    def _get(self, tag: str, filename: str, url: str) -> bytes:
+        entry = self.manifest(tag).get(filename)
+        if entry is None or not os.path.exists(self.blob_path(entry["sha256"])):
+            with FileLock(self.lock_path(tag + "-" + filename)):
+                # another process may have downloaded it meanwhile
+                entry = self._read_manifest(tag)[1].get(filename, entry)
+                if entry is None or not os.path.exists(self.blob_path(entry["sha256"])):
+                    digest, size = self._download(url, entry)
+                    if entry is None:
+                        entry = {"sha256": digest, "size": size}
+                        self._add_to_manifest(tag, filename, entry)
+        with open(self.blob_path(entry["sha256"]), "rb") as f:
+            return f.read()
+
+    def _download(
+        self, url: str, expected: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, int]:
+        """Stream ``url`` into the store, hashing as it is written.
+
+        Returns the digest and size of the file. If ``expected`` is given,
+        a mismatched digest raises a ValueError and nothing is stored.
+        """
+        blobs = os.path.join(self.root, "blobs")
+        os.makedirs(blobs, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, tmp = tempfile.mkstemp(dir=blobs, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, urlopen(url) as response:
+                for chunk in iter(lambda: response.read(_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = sha256.hexdigest()
+            if expected is not None and expected["sha256"] != digest:
+                raise ValueError(
+                    "Hash mismatch for {0}: expected {1}, got {2}"
+                    "".format(url, expected["sha256"], digest)
+                )
+            path = self.blob_path(digest)
+            if os.path.exists(path):
+                os.unlink(tmp)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return digest, size
+
+
+_default_store = None  # type: Optional[DatasetStore]
+
+
+def get_store() -> DatasetStore:
+    """Return the default store, creating it on first use."""
+    global _default_store
+    if _default_store is None:
+        _default_store = DatasetStore()
+    return _default_store
@@ -0,0 +1,157 @@
+"""Generate synthetic datasets with the shape of a real dataset, at any size.
+
+:func:`fit` learns a per-column model from a dataframe: the empirical
+quantiles of numeric and datetime columns (including the date range), and
+the value frequencies of all other columns. Columns are sampled
+independently and with vectorized NumPy calls, one chunk at a time, so
+that arbitrarily large outputs can be streamed to CSV or Parquet with
+bounded memory.
+"""
+
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 1000000
+
+# Number of quantiles kept for numeric columns
+_N_QUANTILES = 1001
+
+
+class _NumericColumn(object):
+    """Samples by interpolating the empirical quantile function."""
+
+    def __init__(self, values: pd.Series):
+        self.dtype = values.dtype
+        self.is_datetime = pd.api.types.is_datetime64_any_dtype(values)
+        self.is_integer = pd.api.types.is_integer_dtype(values) or self.is_datetime
+        valid = values.dropna()
+        self.null_fraction = 1 - len(valid) / len(values) if len(values) else 0.0
+        if self.is_datetime:
+            valid = valid.astype("int64")
+        valid = np.sort(valid.to_numpy(dtype=float))
+        if len(valid) > _N_QUANTILES:
+            probs = np.linspace(0, 1, _N_QUANTILES)
+            self.quantiles = np.quantile(valid, probs)
+        else:
+            self.quantiles = valid
+        self.probs = np.linspace(0, 1, len(self.quantiles))
+
+    def sample(self, n: int, rng: np.random.Generator) -> Any:
+        if len(self.quantiles) == 0:
+            out = np.full(n, np.nan)
+        else:
+            out = np.interp(rng.random(n), self.probs, self.quantiles)
+        if self.null_fraction:
+            out[rng.random(n) < self.null_fraction] = np.nan
+        if self.is_datetime:
+            missing = np.isnan(out)
+            result = np.round(np.where(missing, 0, out)).astype("int64")
+            result = result.astype("datetime64[ns]")
+            result[missing] = np.datetime64("NaT")
+            return result
+        if self.is_integer:
+            return np.round(out).astype(self.dtype)
+        return out.astype(self.dtype)
+
+
+class _CategoricalColumn(object):
+    """Samples values with their observed frequencies."""
+
+    def __init__(self, values: pd.Series):
+        counts = values.value_counts(dropna=False, normalize=True)
+        self.dtype = values.dtype
+        self.values = counts.index.to_numpy(dtype=object)
+        self.probs = counts.to_numpy(dtype=float)
+
+    def sample(self, n: int, rng: np.random.Generator) -> Any:
+        out = self.values[rng.choice(len(self.values), size=n, p=self.probs)]
+        if self.dtype == object:
+            return out
+        return pd.Series(out).astype(self.dtype).to_numpy()
+
+
+def _column_model(values: pd.Series) -> Any:
+    if pd.api.types.is_bool_dtype(values):
+        return _CategoricalColumn(values)
+    if pd.api.types.is_numeric_dtype(values):
+        return _NumericColumn(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return _NumericColumn(values)
+    return _CategoricalColumn(values)
+
+
+class SyntheticModel(object):
+    """Per-column model of a dataframe, used to generate synthetic rows.
+
+    Parameters
+    ----------
+    frame : DataFrame
+        The real data to learn column distributions from.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.columns = list(frame.columns)
+        self.models = [_column_model(frame[col]) for col in self.columns]
+
+    def sample(self, n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                col: model.sample(n_rows, rng)
+                for col, model in zip(self.columns, self.models)
+            },
+            columns=self.columns,
+        )
+
+    def generate(
+        self,
+        n_rows: int,
+        seed: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield dataframes of at most ``chunk_size`` rows, ``n_rows`` in total.
+
+        The row index continues across chunks. If ``n_rows`` is zero, a
+        single empty chunk is produced.
+        """
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_rows or 1, chunk_size):
+            chunk = self.sample(min(chunk_size, n_rows - start), rng)
+            chunk.index += start
+            yield chunk
+
+
+def fit(frame: pd.DataFrame) -> SyntheticModel:
+    """Learn a :class:`SyntheticModel` from a dataframe."""
+    return SyntheticModel(frame)
+
+
+def write_csv(chunks: Iterator[pd.DataFrame], path: str, **kwargs) -> None:
+    """Stream chunks into a single CSV file."""
+    with open(path, "w", newline="") as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=(i == 0), index=False, **kwargs)
+
+
+def write_parquet(chunks: Iterator[pd.DataFrame], path: str, **kwargs) -> None:
+    """Stream chunks into a single Parquet file, one row group per chunk.
+
+    This requires pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Writing Parquet files requires pyarrow to be installed.")
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, **kwargs)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
@@ -0,0 +1,118 @@
+import pandas as pd
+import pytest
+
+from vega_datasets import backends, data
+from vega_datasets.core import Dataset
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError) as err:
+        data.cars(backend="blahblahblah")
+    assert str(err.value).startswith("Unrecognized backend: blahblahblah")
+
+
+@pytest.mark.parametrize("name", Dataset.list_local_datasets())
+def test_arrow_backend(name):
+    pytest.importorskip("pyarrow")
+    df = data(name)
+    table = data(name, backend="arrow")
+    assert table.column_names == list(df.columns)
+    assert table.num_rows == len(df)
+
+
+@pytest.mark.parametrize("name", Dataset.list_local_datasets())
+def test_polars_backend(name):
+    pytest.importorskip("polars")
+    df = data(name)
+    frame = data(name, backend="polars")
+    assert frame.columns == list(df.columns)
+    assert frame.height == len(df)
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+def test_backend_dates(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "polars")
+    expected = data.seattle_temps()["date"]
+    dates = data.seattle_temps(backend=backend)["date"].to_pandas()
+    assert dates.dtype == "datetime64[ns]"
+    assert (dates.values == expected.values).all()
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+@pytest.mark.parametrize("name", Dataset.list_local_datasets())
+def test_backend_date_columns(backend, name):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "polars")
+    df = data(name)
+    frame = data(name, backend=backend).to_pandas()
+    for col in df.columns:
+        assert (df[col].dtype.kind == "M") == (frame[col].dtype.kind == "M"), col
+
+
+def test_arrow_convert_options_keep_forced_types():
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.csv as pacsv
+
+    raw = b"zip_code,latitude\n00501,40.81\n"
+    options = pacsv.ConvertOptions(column_types={"latitude": pa.float32()})
+    table = backends.read_arrow(raw, "csv", {}, ["zip_code"], convert_options=options)
+    assert table["zip_code"].to_pylist() == ["00501"]
+    assert table.schema.field("latitude").type == pa.float32()
+    assert options.column_types == {"latitude": pa.float32()}
+
+
+def test_polars_schema_overrides_keep_forced_types():
+    pl = pytest.importorskip("polars")
+    frame = data.stocks(backend="polars", schema_overrides={"price": pl.Float32})
+    assert frame.schema["price"] == pl.Float32
+    assert frame.schema["date"] == pl.Datetime("ns")
+
+
+def test_arrow_json_kwargs():
+    pytest.importorskip("pyarrow")
+    with pytest.raises(TypeError):
+        data.iris(backend="arrow", orient="records")
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+def test_backend_stocks_pivoted(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "polars")
+    expected = data.stocks(pivoted=True)
+    pivoted = data.stocks(pivoted=True, backend=backend).to_pandas()
+    pd.testing.assert_frame_equal(
+        pivoted.set_index("date"), expected, check_names=False
+    )
+
+
+def test_set_backend():
+    pytest.importorskip("pyarrow")
+    try:
+        data.set_backend("arrow")
+        assert type(data.iris()).__name__ == "Table"
+        assert type(data.iris(backend="pandas")) is pd.DataFrame
+    finally:
+        data.set_backend("pandas")
+    assert type(data.iris()) is pd.DataFrame
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+def test_backend_heterogeneous_records(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "polars")
+    raw = b'[{"a": 1}, {"a": 2, "b": "x"}]'
+    reader = backends.read_arrow if backend == "arrow" else backends.read_polars
+    frame = reader(raw, "json", {}, []).to_pandas()
+    assert list(frame.columns) == ["a", "b"]
+    assert frame["b"].tolist() == [None, "x"]
+    records = [{"a": 1}, {"b": 2.5}]
+    frame = backends.from_records(records, backend).to_pandas()
+    assert list(frame.columns) == ["a", "b"]
+
+
+@pytest.mark.parametrize("backend", ["pandas", "arrow", "polars"])
+def test_dict_datasets_accept_backend(backend, monkeypatch):
+    topology = b'{"type": "Topology", "objects": {}, "arcs": []}'
+    monkeypatch.setattr(Dataset, "raw", lambda self, **kwargs: topology)
+    us = data("us-10m", backend=backend)
+    assert us["type"] == "Topology"
+    assert data.world_110m(backend=backend)["type"] == "Topology"
+    with pytest.raises(ValueError):
+        data.us_10m(backend="blahblahblah")
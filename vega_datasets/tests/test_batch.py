@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+
+from vega_datasets import batch, data, local_data
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_dump_load_roundtrip(shared_memory, monkeypatch):
+    if shared_memory and not batch._USE_SHARED_MEMORY:
+        pytest.skip("shared memory is not available")
+    monkeypatch.setattr(batch, "_USE_SHARED_MEMORY", shared_memory)
+    df = data.cars()
+    payload, name, sizes = batch.dump(df)
+    assert (name is not None) == shared_memory
+    result = batch.load(payload, name, sizes)
+    assert_frame_equal(result, df)
+    # results are writable, and independent of the original
+    result.loc[0, "Cylinders"] = 99
+    assert df.loc[0, "Cylinders"] != 99
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_load_many(workers):
+    names = local_data.list_datasets()
+    results = data.load_many(names, workers=workers)
+    assert sorted(results) == names
+    for name in names:
+        assert_frame_equal(results[name], data(name))
+
+
+def test_load_many_in_band(monkeypatch):
+    # the path taken before Python 3.8
+    monkeypatch.setattr(batch, "_USE_SHARED_MEMORY", False)
+    results = data.load_many(["stocks", "cars"], workers=2)
+    assert_frame_equal(results["stocks"], data.stocks())
+    assert_frame_equal(results["cars"], data.cars())
+
+
+def test_load_many_kwargs():
+    results = data.load_many(["stocks", "sf_temps"], workers=2, use_local=True)
+    assert_frame_equal(results["stocks"], data.stocks())
+    assert_frame_equal(results["sf_temps"], data.sf_temps())
+    results = data.load_many(["stocks"], workers=2, pivoted=True)
+    assert_frame_equal(results["stocks"], data.stocks(pivoted=True))
+
+
+def test_load_many_backend():
+    pytest.importorskip("pyarrow")
+    results = data.load_many(["iris", "cars"], workers=2, backend="arrow")
+    assert results["iris"].equals(data.iris(backend="arrow"))
+    assert type(results["cars"].to_pandas()) is pd.DataFrame
+
+
+def test_load_many_errors():
+    with pytest.raises(AttributeError):
+        data.load_many(["iris", "blahblahblah"], workers=2)
+    with pytest.raises(TypeError):
+        data.load_many(["iris", "stocks"], workers=2, blahblahblah=True)
+
+
+def test_load_many_polars_after_parent_use():
+    pytest.importorskip("polars")
+    # run in a fresh interpreter, so that a deadlock fails instead of hanging
+    code = (
+        "from vega_datasets import data\n"
+        "data.cars(backend='polars')\n"
+        "results = data.load_many(['stocks', 'cars'], workers=2, backend='polars')\n"
+        "assert results['cars'].equals(data.cars(backend='polars'))\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=120)
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from pandas.testing import assert_frame_equal
+import pytest
+
+from vega_datasets import data, store
+from vega_datasets.concurrency import FileLock, SingleFlight
+from vega_datasets.core import Dataset
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    with ThreadPoolExecutor(10) as pool:
+        results = list(pool.map(lambda _: flight.do("key", load), range(10)))
+    assert len(calls) == 1
+    assert len({id(result) for result, _ in results}) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * 9
+
+
+def test_single_flight_shares_error():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def load():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    def follower():
+        started.wait()
+        return flight.do("key", load)
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(flight.do, "key", load), pool.submit(follower)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_concurrent_dataset_loads(monkeypatch):
+    raw = Dataset.raw
+    calls = []
+
+    def slow_raw(self, *args, **kwargs):
+        calls.append(self.name)
+        time.sleep(0.2)
+        return raw(self, *args, **kwargs)
+
+    monkeypatch.setattr(Dataset, "raw", slow_raw)
+    with ThreadPoolExecutor(8) as pool:
+        frames = list(pool.map(lambda _: data.stocks(pivoted=True), range(8)))
+    assert calls == ["stocks"]
+    for frame in frames[1:]:
+        assert_frame_equal(frame, frames[0])
+        assert frame is not frames[0]
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    path = str(tmp_path / "locks" / "x.lock")
+    inside = []
+    overlaps = []
+
+    def work(_):
+        with FileLock(path):
+            inside.append(1)
+            if len(inside) > 1:
+                overlaps.append(1)
+            time.sleep(0.01)
+            inside.pop()
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(work, range(32)))
+    assert not overlaps
+
+
+def test_store_downloads_once(tmp_path, monkeypatch):
+    source = tmp_path / "x.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+    monkeypatch.setattr(store, "LISTING_URL", "file://" + str(tmp_path / "missing"))
+    dataset_store = store.DatasetStore(str(tmp_path / "store"))
+    download = dataset_store._download
+    calls = []
+
+    def slow_download(*args):
+        calls.append(1)
+        time.sleep(0.2)
+        return download(*args)
+
+    monkeypatch.setattr(dataset_store, "_download", slow_download)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(
+            pool.map(
+                lambda _: dataset_store.get("v1", "x.csv", source.as_uri()), range(8)
+            )
+        )
+    assert results == [b"a,b\n1,2\n"] * 8
+    assert len(calls) == 1
@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import time
+
+from pandas.testing import assert_frame_equal
+import pytest
+
+from vega_datasets import data, database, local_data, store
+from vega_datasets.core import Dataset
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "datasets.sqlite")
+
+
+def test_query_where(db_path):
+    airports = data.airports()
+    result = data.airports.query("state = ?", ["TX"], path=db_path)
+    expected = airports[airports.state == "TX"].reset_index(drop=True)
+    assert_frame_equal(result, expected)
+
+
+def test_query_dates_and_columns(db_path):
+    result = data.seattle_temps.query(
+        "date < ?", ["2010-01-02"], columns=["date"], path=db_path
+    )
+    assert list(result.columns) == ["date"]
+    assert result["date"].dtype == "datetime64[ns]"
+    assert len(result) == 24
+
+
+def test_materialize_indexes(db_path):
+    data.airports.materialize(path=db_path)
+    data.iris.materialize(path=db_path, indexes=[("species", "petalWidth")])
+    conn = sqlite3.connect(db_path)
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(airports)")}
+    assert indexes == {"ix_airports_iata", "ix_airports_state"}
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(iris)")}
+    assert indexes == {"ix_iris_species_petalWidth"}
+    conn.close()
+
+
+def test_loader_materialize_and_query(db_path):
+    local_data.materialize(["cars", "iowa-electricity"], path=db_path)
+    result = data.query(
+        "SELECT Origin, COUNT(*) AS n FROM cars GROUP BY Origin ORDER BY Origin",
+        path=db_path,
+    )
+    expected = data.cars().groupby("Origin").size()
+    assert result.set_index("Origin")["n"].tolist() == expected.tolist()
+    assert len(data.query("SELECT * FROM iowa_electricity", path=db_path)) == 51
+
+
+def test_materialize_non_tabular(db_path):
+    with pytest.raises(ValueError) as err:
+        data.miserables.materialize(path=db_path)
+    assert str(err.value) == "Dataset miserables cannot be stored as a table"
+
+
+def test_loader_materialize_all(db_path, tmp_path, monkeypatch):
+    # earthquakes (GeoJSON) and londonBoroughs (TopoJSON) are served from a
+    # fake release, and must be skipped
+    release = tmp_path / "release"
+    release.mkdir()
+    (release / "earthquakes.json").write_text(
+        '{"type": "FeatureCollection", "features": []}'
+    )
+    (release / "londonBoroughs.json").write_text(
+        '{"type": "Topology", "objects": {}, "arcs": [], "transform": {}}'
+    )
+    monkeypatch.setattr(store, "LISTING_URL", "file://" + str(tmp_path / "missing"))
+    monkeypatch.setattr(store, "_default_store", store.DatasetStore(str(tmp_path)))
+    monkeypatch.setattr(Dataset, "_base_url_template", "file://" + str(release) + "/")
+    names = Dataset.list_local_datasets() + ["earthquakes", "londonBoroughs"]
+    monkeypatch.setattr(type(data), "list_datasets", lambda self: names)
+
+    data.materialize(path=db_path)
+    conn = sqlite3.connect(db_path)
+    sql = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    tables = {row[0] for row in conn.execute(sql)}
+    conn.close()
+    expected = {name.replace("-", "_") for name in Dataset.list_local_datasets()}
+    assert tables == expected | {"_vega_datasets_tables"}
+
+
+def test_materialize_non_record_json(db_path, tmp_path, monkeypatch):
+    (tmp_path / "earthquakes.json").write_text('{"type": "FeatureCollection"}')
+    monkeypatch.setattr(store, "LISTING_URL", "file://" + str(tmp_path / "missing"))
+    monkeypatch.setattr(store, "_default_store", store.DatasetStore(str(tmp_path)))
+    monkeypatch.setattr(Dataset, "_base_url_template", "file://" + str(tmp_path) + "/")
+    with pytest.raises(ValueError) as err:
+        data.earthquakes.materialize(path=db_path)
+    assert str(err.value) == "Dataset earthquakes cannot be stored as a table"
+
+
+def test_concurrent_query_materializes_once(db_path, monkeypatch):
+    write_table = database.write_table
+    calls = []
+
+    def slow_write_table(*args, **kwargs):
+        calls.append(args[1])
+        time.sleep(0.2)
+        return write_table(*args, **kwargs)
+
+    monkeypatch.setattr(database, "write_table", slow_write_table)
+    with ThreadPoolExecutor(6) as pool:
+        results = list(
+            pool.map(
+                lambda _: data.airports.query("state = ?", ["TX"], path=db_path),
+                range(6),
+            )
+        )
+    assert calls == ["airports"]
+    for result in results:
+        assert_frame_equal(result, results[0])
+
+
+def test_rematerialize_replaces_table(db_path):
+    data.iris.materialize(path=db_path)
+    data.iris.materialize(path=db_path, indexes=["species"])
+    conn = sqlite3.connect(db_path)
+    sql = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    assert {row[0] for row in conn.execute(sql)} == {"iris", "_vega_datasets_tables"}
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(iris)")}
+    assert indexes == {"ix_iris_species"}
+    assert conn.execute("SELECT COUNT(*) FROM iris").fetchone()[0] == 150
+    conn.close()
@@ -85,3 +85,44 @@ def test_cars_column_names():
 )
 def test_date_types(name, col):
     assert data(name)[col].dtype == "datetime64[ns]"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        name
+        for name in Dataset.list_local_datasets()
+        if Dataset.init(name)._date_formats
+    ],
+)
+def test_date_formats_match_inference(name):
+    loader = Dataset.init(name)
+    fast = loader()
+    for col in loader._date_formats:
+        kwds = {"convert_dates" if loader.format == "json" else "parse_dates": [col]}
+        assert_frame_equal(fast, loader(**kwds))
+
+
+def test_date_format_mismatch_warns():
+    class BadFormat(Dataset):
+        _date_formats = {"date": "%d.%m.%Y"}
+
+    with pytest.warns(UserWarning, match="does not match date format"):
+        df = BadFormat("stocks")()
+    assert df["date"].dtype == "datetime64[ns]"
+
+
+@pytest.mark.parametrize(
+    "name,index_col",
+    [
+        ("stocks", "date"),
+        ("seattle-weather", "date"),
+        ("seattle-temps", 0),
+        ("stocks", ["symbol", "date"]),
+    ],
+)
+def test_date_index_col(name, index_col):
+    df = data(name, index_col=index_col)
+    expected = data(name).set_index(df.index.names)
+    assert_frame_equal(df, expected)
+    assert df.index.get_level_values("date").dtype == "datetime64[ns]"
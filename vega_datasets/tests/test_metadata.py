@@ -1,6 +1,10 @@
+import base64
+import hashlib
+import json
+
 import pytest
 
-from vega_datasets import data
+from vega_datasets import data, local_data, store
 from vega_datasets.core import Dataset
 
 
@@ -24,3 +28,57 @@ def test_metadata():
 
         # References should either be a list, or be None
         assert dataobj.references is None or type(dataobj.references) is list
+
+
+@pytest.mark.parametrize("name", Dataset.list_local_datasets())
+def test_local_info_matches_data(name):
+    loader = getattr(data, name.replace("-", "_"))
+    info = loader.info()
+    raw = loader.raw()
+    df = loader()
+    assert info["size"] == len(raw)
+    assert info["sha256"] == hashlib.sha256(raw).hexdigest()
+    assert info["rows"] == len(df)
+    assert info["columns"] == {col: str(dtype) for col, dtype in df.dtypes.items()}
+
+
+def test_list_datasets_details(tmp_path, monkeypatch):
+    # metadata must not touch the network or the dataset store
+    monkeypatch.setattr(store, "_default_store", store.DatasetStore(str(tmp_path)))
+    details = data.list_datasets(details=True)
+    assert [info["name"] for info in details] == data.list_datasets()
+    for info in details:
+        assert info == Dataset.init(info["name"]).info()
+    local_details = local_data.list_datasets(details=True)
+    assert [info["name"] for info in local_details] == local_data.list_datasets()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_info_from_listing(tmp_path, monkeypatch):
+    listing = {
+        "files": [
+            {
+                "name": "/data/movies.json",
+                "hash": base64.b64encode(bytes(range(32))).decode(),
+                "size": 1234,
+            }
+        ]
+    }
+    (tmp_path / "listing.json").write_text(json.dumps(listing))
+    monkeypatch.setattr(
+        store, "LISTING_URL", "file://" + str(tmp_path / "listing.json")
+    )
+    monkeypatch.setattr(store, "_default_store", store.DatasetStore(str(tmp_path)))
+    assert data.movies.info()["size"] is None
+    info = data.movies.info(remote=True)
+    assert (
+        info
+        == data.list_datasets(details=True, remote=True)[
+            data.list_datasets().index("movies")
+        ]
+    )
+    assert info["size"] == 1234
+    assert info["sha256"] == bytes(range(32)).hex()
+    assert info["rows"] is None
+    # recorded values are used for bundled datasets
+    assert data.iris.info()["size"] == len(data.iris.raw())
@@ -0,0 +1,44 @@
+from pandas.testing import assert_frame_equal
+import pytest
+
+from vega_datasets import data, parallel
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1000)
+
+
+def test_split_ranges():
+    raw = b"a,b\n" + b"".join(b"%d,%d\n" % (i, i) for i in range(100))
+    header_end, ranges = parallel.split_ranges(raw, 7)
+    assert raw[:header_end] == b"a,b\n"
+    assert len(ranges) <= 7
+    assert ranges[0][0] == header_end
+    assert ranges[-1][1] == len(raw)
+    for (_, stop), (start, _) in zip(ranges[:-1], ranges[1:]):
+        assert stop == start
+        assert raw[stop - 1 : stop] == b"\n"
+
+
+@pytest.mark.parametrize("name", ["seattle-temps", "sf-temps", "airports", "stocks"])
+def test_parallel_matches_serial(name, small_chunks):
+    assert_frame_equal(data(name, workers=4), data(name))
+
+
+def test_parallel_consistent_dtypes(small_chunks):
+    rows = [b"%d,x" % i for i in range(500)] + [b"abc,x"] * 10
+    raw = b"a,b\n" + b"\n".join(rows) + b"\n"
+    assert_frame_equal(parallel.read_csv(raw, 4), parallel.read_csv(raw, 1))
+
+
+@pytest.mark.parametrize("header", [None, 0])
+def test_parallel_names(small_chunks, header):
+    raw = b"a,b\n" + b"".join(b"%d,%d\n" % (i, i) for i in range(1000))
+    kwds = {"names": ["x", "y"]}
+    if header is not None:
+        kwds["header"] = header
+    expected = parallel.read_csv(raw, 1, **kwds)
+    result = parallel.read_csv(raw, 4, **kwds)
+    assert len(result) == len(expected) == (1000 if header == 0 else 1001)
+    assert_frame_equal(result, expected)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from vega_datasets import data
+from vega_datasets.spatial import SpatialIndex, haversine
+
+
+def _brute_force(index, lat, lon):
+    distances = haversine(lat, lon, index.lat, index.lon)
+    distances[np.isnan(distances)] = np.inf
+    return distances
+
+
+@pytest.mark.parametrize("k", [1, 5, 50])
+def test_nearest_matches_brute_force(k):
+    index = data.airports.spatial_index()
+    rng = np.random.default_rng(0)
+    for lat, lon in zip(rng.uniform(15, 70, 50), rng.uniform(-170, -60, 50)):
+        positions, distances = index.nearest(lat, lon, k)
+        expected = np.sort(_brute_force(index, lat, lon))[:k]
+        np.testing.assert_allclose(distances, expected)
+        np.testing.assert_allclose(
+            haversine(lat, lon, index.lat[positions], index.lon[positions]), distances
+        )
+
+
+@pytest.mark.parametrize("radius", [10, 200, 2000])
+def test_within_matches_brute_force(radius):
+    index = data.airports.spatial_index()
+    rng = np.random.default_rng(1)
+    for lat, lon in zip(rng.uniform(15, 70, 50), rng.uniform(-170, -60, 50)):
+        positions, distances = index.within(lat, lon, radius)
+        expected = np.flatnonzero(_brute_force(index, lat, lon) <= radius)
+        assert sorted(positions) == sorted(expected)
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_antimeridian_and_missing_points():
+    lat = [0.0, 0.0, 10.0, np.nan, 80.0]
+    lon = [179.9, -179.9, 0.0, 0.0, 100.0]
+    index = SpatialIndex(lat, lon)
+    assert len(index) == 4
+    positions, distances = index.nearest(0.0, 179.95, k=2)
+    assert sorted(positions) == [0, 1]
+    positions, _ = index.within(0.0, -179.99, 50)
+    assert sorted(positions) == [0, 1]
+    positions, _ = index.nearest(89.0, 0.0, k=1)
+    assert list(positions) == [4]
+
+
+def test_spatial_index_cached():
+    index = data.airports.spatial_index()
+    assert data.airports.spatial_index() is index
+    assert len(index.frame) == len(data.airports())
+    positions, _ = index.nearest(47.449, -122.309)
+    assert index.frame.iloc[positions[0]]["iata"] == "SEA"
+
+
+def test_spatial_index_la_riots():
+    index = data.la_riots.spatial_index()
+    positions, distances = index.within(34.05, -118.25, 5)
+    assert len(positions) > 0
+    assert distances.max() <= 5
+
+
+def test_spatial_index_no_coordinates():
+    with pytest.raises(ValueError) as err:
+        data.iris.spatial_index()
+    assert str(err.value) == "Dataset iris has no latitude/longitude columns"
@@ -0,0 +1,135 @@
+import base64
+import hashlib
+import json
+import os
+import pathlib
+
+import pytest
+
+from vega_datasets import data, store
+
+
+@pytest.fixture
+def tmp_store(tmp_path, monkeypatch):
+    # no network access: the jsDelivr listing is replaced by missing files
+    listing = "file://" + str(tmp_path / "listing-{version}.json")
+    monkeypatch.setattr(store, "LISTING_URL", listing)
+    monkeypatch.setattr(store, "_default_store", store.DatasetStore(str(tmp_path)))
+    return store.get_store()
+
+
+def _release(root, tag, files):
+    """Write a fake release with the given files, returning its base url"""
+    directory = root / "release" / tag
+    directory.mkdir(parents=True)
+    for filename, content in files.items():
+        (directory / filename).write_bytes(content)
+    return directory.as_uri() + "/"
+
+
+def test_store_deduplicates_across_tags(tmp_store, tmp_path):
+    url_a = _release(tmp_path, "v1", {"x.csv": b"a,b\n1,2\n"})
+    url_b = _release(tmp_path, "v2", {"x.csv": b"a,b\n1,2\n"})
+    assert tmp_store.get("v1", "x.csv", url_a + "x.csv") == b"a,b\n1,2\n"
+    assert tmp_store.get("v2", "x.csv", url_b + "x.csv") == b"a,b\n1,2\n"
+
+    digest = hashlib.sha256(b"a,b\n1,2\n").hexdigest()
+    assert tmp_store.manifest("v1") == tmp_store.manifest("v2")
+    assert tmp_store.manifest("v1")["x.csv"] == {"sha256": digest, "size": 8}
+    blobs = [p for p in pathlib.Path(tmp_store.root, "blobs").rglob("*") if p.is_file()]
+    assert blobs == [pathlib.Path(tmp_store.blob_path(digest))]
+
+
+def test_store_skips_download_of_known_digest(tmp_store, tmp_path):
+    url = _release(tmp_path, "v1", {"x.csv": b"abc"})
+    tmp_store.get("v1", "x.csv", url + "x.csv")
+    digest = tmp_store.manifest("v1")["x.csv"]["sha256"]
+    listing = {
+        "files": [
+            {
+                "name": "/data/x.csv",
+                "hash": base64.b64encode(bytes.fromhex(digest)).decode(),
+                "size": 3,
+            }
+        ]
+    }
+    (tmp_path / "listing-2.json").write_text(json.dumps(listing))
+    # the url for v2 does not exist, so this must be served from the store
+    assert tmp_store.get("v2", "x.csv", url + "missing.csv") == b"abc"
+
+
+def test_store_hash_mismatch(tmp_store, tmp_path):
+    url = _release(tmp_path, "v1", {"x.csv": b"abc"})
+    listing = {"files": [{"name": "/data/x.csv", "hash": "AAAA", "size": 3}]}
+    (tmp_path / "listing-1.json").write_text(json.dumps(listing))
+    with pytest.raises(ValueError) as err:
+        tmp_store.get("v1", "x.csv", url + "x.csv")
+    assert str(err.value).startswith("Hash mismatch")
+    assert not os.path.exists(os.path.join(tmp_store.root, "blobs", "ab"))
+
+
+def test_load_at_tag(tmp_store, tmp_path, monkeypatch):
+    raw = data.iris.raw()
+    url = _release(tmp_path, "v0.0.1", {"iris.json": raw})
+    monkeypatch.setattr(
+        type(data.iris), "_base_url_template", url.replace("v0.0.1", "{tag}")
+    )
+    assert data.iris.raw(tag="v0.0.1") == raw
+    assert data.iris(tag="v0.0.1").equals(data.iris())
+
+
+def test_store_retries_listing(tmp_store, tmp_path, monkeypatch):
+    url = _release(tmp_path, "v1", {"x.csv": b"abc", "y.csv": b"xyz"})
+    calls = []
+    remote_manifest = store.DatasetStore._remote_manifest
+
+    def counting(self, tag):
+        calls.append(tag)
+        return remote_manifest(self, tag)
+
+    monkeypatch.setattr(store.DatasetStore, "_remote_manifest", counting)
+    # the listing is unreachable: it is tried once, and x.csv is recorded
+    assert tmp_store.get("v1", "x.csv", url + "x.csv") == b"abc"
+    assert tmp_store.get("v1", "y.csv", url + "y.csv") == b"xyz"
+    assert calls == ["v1"]
+    assert set(tmp_store.manifest("v1")) == {"x.csv", "y.csv"}
+
+    digest = hashlib.sha256(b"a,b\n").hexdigest()
+    listing = {
+        "files": [
+            {
+                "name": "/data/z.csv",
+                "hash": base64.b64encode(bytes.fromhex(digest)).decode(),
+                "size": 4,
+            }
+        ]
+    }
+    (tmp_path / "listing-1.json").write_text(json.dumps(listing))
+    # a new session fetches the listing, which now verifies z.csv
+    new_store = store.DatasetStore(tmp_store.root)
+    assert set(new_store.manifest("v1")) == {"x.csv", "y.csv", "z.csv"}
+    assert calls == ["v1", "v1"]
+    (tmp_path / "release" / "v1" / "z.csv").write_bytes(b"bad\n")
+    with pytest.raises(ValueError):
+        new_store.get("v1", "z.csv", url + "z.csv")
+    store.DatasetStore(tmp_store.root).manifest("v1")
+    assert calls == ["v1", "v1"]
+
+
+def test_store_unwritable(tmp_path, monkeypatch):
+    url = _release(tmp_path, "v1", {"x.csv": b"abc"})
+    (tmp_path / "file").write_bytes(b"")
+    # the store root cannot be created below a regular file
+    unwritable = store.DatasetStore(str(tmp_path / "file" / "store"))
+    with pytest.warns(UserWarning, match="Cannot write to the dataset store"):
+        assert unwritable.get("v1", "x.csv", url + "x.csv") == b"abc"
+
+    def denied(self):
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setattr(store.FileLock, "__enter__", denied)
+    with pytest.warns(UserWarning, match="without caching"):
+        assert store.DatasetStore(str(tmp_path)).get("v1", "x.csv", url + "x.csv")
+    # download errors are not hidden
+    with pytest.raises(OSError), pytest.warns(UserWarning):
+        unwritable.get("v1", "missing.csv", url + "missing.csv")
@@ -0,0 +1,49 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+import pytest
+
+from vega_datasets import data
+
+
+@pytest.mark.parametrize("name", ["cars", "seattle-weather", "stocks", "airports"])
+def test_synthesize_shape(name):
+    real = data(name)
+    fake = getattr(data, name.replace("-", "_")).synthesize(5000, seed=0)
+    assert len(fake) == 5000
+    assert_series_equal(fake.dtypes, real.dtypes)
+    for col in real.columns:
+        if pd.api.types.is_numeric_dtype(real[col]) or real[col].dtype.kind == "M":
+            assert fake[col].min() >= real[col].min()
+            assert fake[col].max() <= real[col].max()
+        else:
+            assert set(fake[col].dropna()) <= set(real[col].dropna())
+
+
+def test_synthesize_seed():
+    first = data.stocks.synthesize(1000, seed=42, chunk_size=300)
+    second = data.stocks.synthesize(1000, seed=42, chunk_size=300)
+    assert_frame_equal(first, second)
+    assert list(first.index) == list(range(1000))
+
+
+def test_synthesize_to_csv(tmp_path):
+    path = str(tmp_path / "cars.csv")
+    assert data.cars.synthesize(2500, seed=0, path=path, chunk_size=1000) is None
+    result = pd.read_csv(path)
+    assert list(result.columns) == list(data.cars().columns)
+    assert len(result) == 2500
+
+
+def test_synthesize_to_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "stocks.parquet")
+    data.stocks.synthesize(2500, seed=0, path=path, chunk_size=1000)
+    result = pd.read_parquet(path)
+    expected = data.stocks.synthesize(2500, seed=0, chunk_size=1000)
+    assert_frame_equal(result, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_synthesize_bad_extension(tmp_path):
+    with pytest.raises(ValueError) as err:
+        data.cars.synthesize(10, path=str(tmp_path / "cars.xlsx"))
+    assert str(err.value).startswith("Unrecognized file extension")
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vega_datasets import data
+from vega_datasets.core import Dataset
+from vega_datasets.timeseries import TimeIndex
+
+RANGES = [
+    ("2010-03-01", "2010-06-15"),
+    ("2004-08-19", None),
+    (None, "2001-01-01"),
+    ("2010-01-01 05:00", "2010-01-01 05:00"),
+    ("2020-01-01", "2000-01-01"),
+]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        name
+        for name in Dataset.list_local_datasets()
+        if Dataset.init(name)._time_column is not None
+    ],
+)
+@pytest.mark.parametrize("start,end", RANGES)
+def test_range_matches_mask(name, start, end):
+    loader = Dataset.init(name)
+    df = loader()
+    dates = df[loader._time_column]
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= dates >= pd.Timestamp(start)
+    if end is not None:
+        mask &= dates <= pd.Timestamp(end)
+    result = loader(start=start, end=end)
+    pd.testing.assert_frame_equal(result, df[mask])
+
+
+def test_range_cached():
+    index = data.stocks.time_index()
+    assert data.stocks.time_index() is index
+    assert data.stocks.time_index(backend="pandas") is index
+
+
+def test_range_result_is_a_copy():
+    df = data.seattle_weather(start="2012-01-01", end="2012-01-31")
+    df["weather"] = "sun"
+    assert not (data.seattle_weather(start="2012-01-01")["weather"] == "sun").all()
+
+
+def test_range_pivoted_stocks():
+    df = data.stocks(pivoted=True, start="2009-01-01")
+    assert df.index.min() == pd.Timestamp("2009-01-01")
+    assert list(df.columns) == ["AAPL", "AMZN", "GOOG", "IBM", "MSFT"]
+
+
+def test_range_with_parser_kwargs():
+    df = data.stocks(start="2009-01-01", end="2009-12-31", usecols=["date", "price"])
+    assert list(df.columns) == ["date", "price"]
+    assert len(df) == 60
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+def test_range_backends(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "polars")
+    expected = data.seattle_temps(start="2010-03-01", end="2010-03-02")
+    result = data.seattle_temps(start="2010-03-01", end="2010-03-02", backend=backend)
+    assert len(result) == len(expected)
+    stocks = data.stocks(start="2009-01-01", end="2009-12-31", backend=backend)
+    assert len(stocks) == 60
+
+
+def test_time_index_unsorted_and_missing():
+    dates = pd.to_datetime(["2001-01-03", None, "2001-01-01", "2001-01-02"])
+    frame = pd.DataFrame({"date": dates, "value": [3, 0, 1, 2]})
+    index = TimeIndex(frame, "date")
+    assert len(index) == 3
+    assert list(index.rows("2001-01-02")) == [0, 3]
+    assert list(index.slice(end="2001-01-02")["value"]) == [1, 2]
+    assert np.array_equal(index.rows(), [0, 2, 3])
+
+
+def test_range_not_a_time_series():
+    with pytest.raises(ValueError) as err:
+        data.iris(start="2000-01-01")
+    assert str(err.value) == "Dataset iris is not a time series"
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from vega_datasets import data
+from vega_datasets.core import Dataset
+
+
+@pytest.mark.parametrize("name", Dataset.list_local_datasets())
+def test_to_values(name):
+    loader = getattr(data, name.replace("-", "_"))
+    values = json.loads(loader.to_values())
+    df = loader()
+    assert len(values) == len(df)
+    assert list(values[0]) == list(df.columns)
+    if loader.format == "json":
+        assert loader.to_values() == loader.raw()
+
+
+def test_to_values_dates():
+    values = json.loads(data.stocks.to_values())
+    assert values[0] == {
+        "symbol": "MSFT",
+        "date": "2000-01-01T00:00:00",
+        "price": 39.81,
+    }
+    values = json.loads(data.seattle_temps.to_values())
+    assert values[1] == {"date": "2010-01-01T01:00:00", "temp": 39.2}
+
+
+def test_to_values_cached():
+    assert data.airports.to_values() is data.airports.to_values()
+
+
+def test_to_values_invalid():
+    with pytest.raises(ValueError) as err:
+        data.ffox.to_values()
+    assert (
+        str(err.value) == "Dataset ffox with format png cannot be converted to values"
+    )
+
+
+def test_to_vega_data():
+    inline = json.loads(data.iris.to_vega_data())
+    assert inline == {"values": json.loads(data.iris.raw())}
+    assert json.loads(data.iris.to_vega_data(inline=False)) == {
+        "url": data.iris.url,
+        "format": {"type": "json"},
+    }
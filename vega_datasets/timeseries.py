@@ -0,0 +1,93 @@
+"""Sorted date index for selecting time ranges of time-series datasets.
+
+A :class:`TimeIndex` keeps a parsed copy of a dataset together with the
+positions of its rows in date order. A range query is then two binary
+searches over the sorted dates followed by a slice (or, for datasets whose
+rows are not in date order, a gather) of the cached columns, so repeated
+small window queries never re-read or re-parse the source file.
+"""
+
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+_Rows = Union[slice, np.ndarray]
+
+
+def _dates(data: Any, column: str, backend: str) -> np.ndarray:
+    if backend == "arrow":
+        return data.column(column).to_numpy()
+    return np.asarray(data[column].to_numpy())
+
+
+def _take(data: Any, rows: _Rows, backend: str) -> Any:
+    if backend == "pandas":
+        return data.iloc[rows].copy()
+    if isinstance(rows, slice):
+        return data.slice(rows.start, rows.stop - rows.start)
+    if backend == "arrow":
+        return data.take(rows)
+    return data[rows]
+
+
+def _bound(value: Any, dtype: np.dtype) -> np.datetime64:
+    return pd.Timestamp(value).to_datetime64().astype(dtype)
+
+
+class TimeIndex(object):
+    """Index over the date column of a pandas, Arrow or Polars dataset.
+
+    Parameters
+    ----------
+    data : DataFrame, Table
+        The parsed dataset, kept as ``index.data``.
+    column : string
+        Name of the date column.
+    backend : string
+        The backend that produced ``data``: 'pandas', 'arrow' or 'polars'.
+    """
+
+    def __init__(self, data: Any, column: str, backend: str = "pandas"):
+        self.data = data
+        self.column = column
+        self.backend = backend
+        dates = _dates(data, column, backend)
+        if not np.issubdtype(dates.dtype, np.datetime64):
+            raise ValueError("Column {0} does not contain dates".format(column))
+        valid = np.flatnonzero(~np.isnat(dates))
+        if len(valid) == len(dates) and np.all(dates[1:] >= dates[:-1]):
+            self._order = None  # type: Any
+            self.dates = dates
+        else:
+            self._order = valid[np.argsort(dates[valid], kind="stable")]
+            self.dates = dates[self._order]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def rows(self, start: Any = None, end: Any = None) -> _Rows:
+        """Return the rows with ``start <= date <= end``, as a slice or as
+        an array of positions in their original order.
+
+        ``start`` and ``end`` may be anything accepted by ``pd.Timestamp``;
+        if None, the range is unbounded on that side.
+        """
+        lo, hi = 0, len(self.dates)
+        if start is not None:
+            lo = int(np.searchsorted(self.dates, _bound(start, self.dates.dtype)))
+        if end is not None:
+            end = _bound(end, self.dates.dtype)
+            hi = int(np.searchsorted(self.dates, end, side="right"))
+        hi = max(hi, lo)
+        if self._order is None:
+            return slice(lo, hi)
+        return np.sort(self._order[lo:hi])
+
+    def slice(self, start: Any = None, end: Any = None) -> Any:
+        """Return the rows of ``data`` with ``start <= date <= end``.
+
+        Rows keep their original order (and, for pandas, their index
+        labels), exactly as with boolean masking on the full dataset.
+        """
+        return _take(self.data, self.rows(start, end), self.backend)